@@ -1 +1,9 @@
 # app 패키지
+import os
+import sys
+
+# backend 디렉토리를 sys.path에 한 번만 등록하여 models 패키지를 최상위 모듈로 import할 수 있도록 함
+# (app 하위 모듈은 이 패키지 초기화 이후에 로드되므로 개별 모듈에서 경로를 다시 계산할 필요가 없음)
+BACKEND_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_PATH not in sys.path:
+    sys.path.insert(0, BACKEND_PATH)
@@ -4,26 +4,34 @@ OpenAI API를 사용하여 뉴스를 분석하고 산업/주식 예측을 수행
 """
 import os
 import json
+import logging
+from functools import lru_cache
 from typing import List, Dict, Optional
 from openai import OpenAI
 from sqlalchemy.orm import Session
 from sqlalchemy import text, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import date, datetime, timedelta
 import pytz
-import sys
-import os as os_module
+from models.models import NewsArticle, Report, ReportIndustry, ReportStock, report_news
 
-# models 경로 추가
-backend_path = os_module.path.dirname(os_module.path.dirname(os_module.path.abspath(__file__)))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
-from models.models import NewsArticle, Report, ReportIndustry, ReportStock
+logger = logging.getLogger(__name__)
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# HNSW 인덱스 검색 시 탐색 후보 수 (pgvector 기본값 40, 최대 1000)
+HNSW_EF_SEARCH = 100
+HNSW_EF_SEARCH_MAX = 1000
+
+# AI 분석 프롬프트에 포함할 최대 뉴스 개수 (SQL LIMIT과 동일하게 사용)
+MAX_ANALYSIS_NEWS = 20
+
+@lru_cache(maxsize=1)
 def get_openai_client():
-    """OpenAI 클라이언트를 지연 초기화합니다."""
+    """
+    OpenAI 클라이언트를 지연 초기화합니다.
+    한 번 만든 클라이언트를 재사용하여 내부 httpx 연결 풀(keep-alive)을 모든 호출이 공유합니다.
+    """
     if not OPENAI_API_KEY:
         return None
     return OpenAI(api_key=OPENAI_API_KEY)
@@ -41,11 +49,11 @@ def create_query_embedding(query_text: str) -> Optional[List[float]]:
         벡터 임베딩 리스트 (1536 차원) 또는 None (실패 시)
     """
     if not OPENAI_API_KEY:
-        print("⚠️  OPENAI_API_KEY 환경 변수가 설정되지 않았습니다. 쿼리 임베딩을 생성할 수 없습니다.")
+        logger.warning("⚠️  OPENAI_API_KEY 환경 변수가 설정되지 않았습니다. 쿼리 임베딩을 생성할 수 없습니다.")
         return None
     
     if not query_text or not query_text.strip():
-        print("⚠️  빈 쿼리 텍스트로는 임베딩을 생성할 수 없습니다.")
+        logger.warning("⚠️  빈 쿼리 텍스트로는 임베딩을 생성할 수 없습니다.")
         return None
     
     try:
@@ -60,15 +68,35 @@ def create_query_embedding(query_text: str) -> Optional[List[float]]:
         )
         
         embedding = response.data[0].embedding
-        print(f"✅ 쿼리 임베딩 생성 완료: {len(embedding)} 차원")
+        logger.debug("✅ 쿼리 임베딩 생성 완료: %d 차원", len(embedding))
         return embedding
     except Exception as e:
-        import traceback
-        print(f"⚠️  쿼리 임베딩 생성 실패: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("⚠️  쿼리 임베딩 생성 실패: %s", e)
         return None
 
 
+def _load_articles_in_order(db: Session, article_ids: List[int]) -> List[NewsArticle]:
+    """
+    ID 목록으로 NewsArticle을 한 번에 조회하고 SQL 정렬 순서(유사도/최신순)를 유지합니다.
+    IN 조회는 순서를 보장하지 않으므로, 상위 N개 선택이 SQL에서 정한 순서대로 적용되도록 재정렬합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        article_ids: 정렬된 뉴스 ID 리스트
+    
+    Returns:
+        article_ids 순서를 따르는 NewsArticle 객체 리스트
+    """
+    if not article_ids:
+        return []
+    
+    articles_by_id = {
+        article.id: article
+        for article in db.query(NewsArticle).filter(NewsArticle.id.in_(article_ids))
+    }
+    return [articles_by_id[article_id] for article_id in article_ids if article_id in articles_by_id]
+
+
 def search_similar_news_by_embedding(
     db: Session,
     query_embedding: List[float],
@@ -112,50 +140,55 @@ def search_similar_news_by_embedding(
     start_str = start_datetime.isoformat()
     end_str = end_datetime.isoformat()
     
-    # 벡터를 PostgreSQL 배열 형식으로 변환
-    embedding_str = "[" + ",".join(map(str, query_embedding)) + "]"
+    # 벡터를 pgvector 텍스트 형식 "[v1,v2,...]"으로 변환 (JSON 배열과 동일, C 인코더 사용)
+    embedding_str = json.dumps(query_embedding, separators=(",", ":"))
     
     try:
-        sqlalchemy_conn = db.connection()
-        raw_conn = None
-        if hasattr(sqlalchemy_conn, 'connection'):
-            raw_conn = sqlalchemy_conn.connection
-            if hasattr(raw_conn, 'driver_connection'):
-                raw_conn = raw_conn.driver_connection
-        else:
-            raw_conn = sqlalchemy_conn
+        # 세션의 연결을 그대로 사용 (SET LOCAL은 현재 트랜잭션에만 적용)
+        # HNSW 인덱스 탐색 후보 수 설정 (날짜 필터가 인덱스 탐색 이후에 적용되므로 limit보다 넉넉하게)
+        db.execute(
+            text("SET LOCAL hnsw.ef_search = :ef_search"),
+            {"ef_search": min(HNSW_EF_SEARCH_MAX, max(HNSW_EF_SEARCH, limit * 3))}
+        )
+        
+        # 벡터 유사도 검색 (cosine distance 사용)
+        # <=> 연산자는 cosine distance를 반환 (작을수록 유사함)
+        similarity_sql = text("""
+            SELECT id, embedding <=> CAST(:embedding AS vector(1536)) AS distance
+            FROM news_articles
+            WHERE embedding IS NOT NULL
+            AND metadata IS NOT NULL
+            AND metadata->>'published_date' IS NOT NULL
+            AND (
+                (metadata->>'published_date')::timestamp >= CAST(:start_date AS timestamp)
+                AND (metadata->>'published_date')::timestamp <= CAST(:end_date AS timestamp)
+            )
+            ORDER BY embedding <=> CAST(:embedding AS vector(1536))
+            LIMIT :limit
+        """)
+        params = {"embedding": embedding_str, "start_date": start_str, "end_date": end_str, "limit": limit}
+        rows = db.execute(similarity_sql, params).all()
+        
+        # 인덱스 탐색 후 날짜 필터로 후보가 부족해진 경우 정확한 전체 스캔으로 재조회
+        if len(rows) < limit:
+            logger.info("⚠️  HNSW 인덱스 검색 결과 부족 (%d/%d개), 전체 스캔으로 재조회", len(rows), limit)
+            db.execute(text("SET LOCAL enable_indexscan = off"))
+            rows = db.execute(similarity_sql, params).all()
+            db.execute(text("RESET enable_indexscan"))
         
-        cursor = raw_conn.cursor()
+        db.execute(text("RESET hnsw.ef_search"))
         
-        try:
-            # 벡터 유사도 검색 (cosine distance 사용)
-            # <=> 연산자는 cosine distance를 반환 (작을수록 유사함)
-            cursor.execute("""
-                SELECT id, embedding <=> %s::vector(1536) AS distance
-                FROM news_articles
-                WHERE embedding IS NOT NULL
-                AND metadata IS NOT NULL
-                AND metadata->>'published_date' IS NOT NULL
-                AND (
-                    (metadata->>'published_date')::timestamp >= %s::timestamp
-                    AND (metadata->>'published_date')::timestamp <= %s::timestamp
-                )
-                ORDER BY embedding <=> %s::vector(1536)
-                LIMIT %s
-            """, (embedding_str, start_str, end_str, embedding_str, limit))
-            
-            article_ids = [row[0] for row in cursor.fetchall()]
-            articles = db.query(NewsArticle).filter(NewsArticle.id.in_(article_ids)).all() if article_ids else []
-            
-            print(f"✅ 벡터 유사도 검색 완료: {len(articles)}개 (기간: {start_datetime.strftime('%Y-%m-%d %H:%M')} ~ {end_datetime.strftime('%Y-%m-%d %H:%M')}, 상위 {limit}개)")
-            return articles
-        finally:
-            cursor.close()
+        article_ids = [row[0] for row in rows]
+        articles = _load_articles_in_order(db, article_ids)
+        
+        logger.info(
+            "✅ 벡터 유사도 검색 완료: %d개 (기간: %s ~ %s, 상위 %d개)",
+            len(articles), start_datetime, end_datetime, limit
+        )
+        return articles
         
     except Exception as e:
-        import traceback
-        print(f"⚠️  벡터 유사도 검색 실패: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("⚠️  벡터 유사도 검색 실패: %s", e)
         raise ValueError(f"벡터 유사도 검색 중 오류가 발생했습니다: {e}")
 
 
@@ -219,58 +252,82 @@ def get_news_by_date_range(
     # SQL 쿼리: embedding이 NULL이 아니고, metadata의 published_date가 범위 내인 뉴스 조회
     # metadata JSONB 필드에서 published_date 추출 및 필터링
     # published_date는 ISO 형식 문자열이므로 timestamp로 변환
-    # psycopg2의 raw connection을 사용하여 %s 스타일 파라미터 바인딩 사용
     try:
-        sqlalchemy_conn = db.connection()
-        raw_conn = None
-        if hasattr(sqlalchemy_conn, 'connection'):
-            raw_conn = sqlalchemy_conn.connection
-            if hasattr(raw_conn, 'driver_connection'):
-                raw_conn = raw_conn.driver_connection
-        else:
-            raw_conn = sqlalchemy_conn
+        params = {"start_date": start_str, "end_date": end_str}
+        
+        # LIMIT 절 추가 (제공된 경우)
+        limit_clause = ""
+        if limit is not None:
+            limit_clause = "LIMIT :limit"
+            params["limit"] = limit
         
-        cursor = raw_conn.cursor()
+        result = db.execute(text(f"""
+            SELECT id FROM news_articles
+            WHERE embedding IS NOT NULL
+            AND metadata IS NOT NULL
+            AND metadata->>'published_date' IS NOT NULL
+            AND (
+                (metadata->>'published_date')::timestamp >= CAST(:start_date AS timestamp)
+                AND (metadata->>'published_date')::timestamp <= CAST(:end_date AS timestamp)
+            )
+            ORDER BY (metadata->>'published_date')::timestamp DESC
+            {limit_clause}
+        """), params)
+        
+        article_ids = list(result.scalars())
+        articles = _load_articles_in_order(db, article_ids)
         
-        try:
-            # LIMIT 절 추가 (제공된 경우)
-            limit_clause = f"LIMIT {limit}" if limit is not None else ""
-            
-            cursor.execute(f"""
-                SELECT id FROM news_articles
-                WHERE embedding IS NOT NULL
-                AND metadata IS NOT NULL
-                AND metadata->>'published_date' IS NOT NULL
-                AND (
-                    (metadata->>'published_date')::timestamp >= %s::timestamp
-                    AND (metadata->>'published_date')::timestamp <= %s::timestamp
-                )
-                ORDER BY (metadata->>'published_date')::timestamp DESC
-                {limit_clause}
-            """, (start_str, end_str))
-            
-            article_ids = [row[0] for row in cursor.fetchall()]
-            articles = db.query(NewsArticle).filter(NewsArticle.id.in_(article_ids)).all() if article_ids else []
-            
-            print(f"✅ 벡터 DB에서 뉴스 조회 완료: {len(articles)}개 (기간: {start_datetime.strftime('%Y-%m-%d %H:%M')} ~ {end_datetime.strftime('%Y-%m-%d %H:%M')})")
-            return articles
-        finally:
-            cursor.close()
+        logger.info(
+            "✅ 벡터 DB에서 뉴스 조회 완료: %d개 (기간: %s ~ %s)",
+            len(articles), start_datetime, end_datetime
+        )
+        return articles
         
     except Exception as e:
-        import traceback
-        print(f"⚠️  벡터 DB 뉴스 조회 실패: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("⚠️  벡터 DB 뉴스 조회 실패: %s", e)
         raise ValueError(f"벡터 DB에서 뉴스를 조회할 수 없습니다: {e}")
 
 
+def _format_news_item(idx: int, article: NewsArticle) -> str:
+    """
+    분석 프롬프트에 들어갈 뉴스 한 건을 "번호. 제목/URL/발행일/내용" 형식의 문자열로 만듭니다.
+    
+    Args:
+        idx: 프롬프트 내 뉴스 번호 (1부터 시작)
+        article: 뉴스 기사
+    
+    Returns:
+        포맷된 뉴스 문자열
+    """
+    # metadata에서 정보 추출
+    url = article.url or "URL 없음"
+    published_date = "날짜 정보 없음"
+    
+    metadata = article.article_metadata
+    if metadata and isinstance(metadata, dict):
+        url = metadata.get("url", article.url) or "URL 없음"
+        published_date = metadata.get("published_date", "날짜 정보 없음")
+    
+    # published_at이 있으면 사용
+    if article.published_at:
+        published_date = article.published_at.strftime("%Y-%m-%d %H:%M:%S")
+    
+    content = article.content
+    content_preview = content[:500] if content else "내용 없음"
+    
+    return f"""{idx}. 제목: {article.title}
+   URL: {url}
+   발행일: {published_date}
+   내용: {content_preview}"""
+
+
 def analyze_news_with_ai(news_articles: List[NewsArticle]) -> Dict:
     """
     뉴스 기사들을 AI로 분석하여 파급효과, 산업, 주식을 예측합니다.
     LLM이 참조한 기사를 추적할 수 있도록 제목, URL, 발행일을 포함합니다.
     
     Args:
-        news_articles: 분석할 뉴스 기사 리스트 (최대 20개까지 분석)
+        news_articles: 분석할 뉴스 기사 리스트 (앞에서부터 최대 MAX_ANALYSIS_NEWS개까지 분석)
     
     Returns:
         분석 결과 딕셔너리. 다음 형식을 따릅니다:
@@ -349,31 +406,11 @@ def analyze_news_with_ai(news_articles: List[NewsArticle]) -> Dict:
     if not client:
         raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
     
-    # 뉴스 요약 (제목, URL, 발행일, 내용 포함)
-    news_items = []
-    for idx, article in enumerate(news_articles[:20], 1):  # 최대 20개까지 분석
-        # metadata에서 정보 추출
-        url = article.url or "URL 없음"
-        published_date = "날짜 정보 없음"
-        
-        if article.article_metadata:
-            metadata = article.article_metadata
-            if isinstance(metadata, dict):
-                url = metadata.get("url", article.url) or "URL 없음"
-                published_date = metadata.get("published_date", "날짜 정보 없음")
-        
-        # published_at이 있으면 사용
-        if article.published_at:
-            published_date = article.published_at.strftime("%Y-%m-%d %H:%M:%S")
-        
-        content_preview = article.content[:500] if article.content else "내용 없음"
-        
-        news_items.append(f"""{idx}. 제목: {article.title}
-   URL: {url}
-   발행일: {published_date}
-   내용: {content_preview}""")
-    
-    news_summary = "\n\n".join(news_items)
+    # 뉴스 요약 (제목, URL, 발행일, 내용 포함), 중간 리스트 없이 한 번에 join
+    news_summary = "\n\n".join(
+        _format_news_item(idx, article)
+        for idx, article in enumerate(news_articles[:MAX_ANALYSIS_NEWS], 1)  # 최대 20개까지 분석
+    )
     
     prompt = f"""다음 뉴스 기사들을 분석하여 주식 시장에 미치는 영향을 분석해주세요.
 
@@ -422,13 +459,11 @@ summary 필드는 반드시 500자 이상 800자 이하로 작성해주세요.""
         
         return result
     except json.JSONDecodeError as e:
-        print(f"JSON 파싱 실패: {e}")
-        print(f"응답 텍스트: {result_text if 'result_text' in locals() else 'N/A'}")
+        logger.warning("JSON 파싱 실패: %s", e)
+        logger.debug("응답 텍스트: %s", result_text if 'result_text' in locals() else 'N/A')
         raise ValueError(f"AI 분석 결과를 파싱할 수 없습니다: {e}")
     except Exception as e:
-        import traceback
-        print(f"OpenAI API 호출 실패: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("OpenAI API 호출 실패: %s", e)
         raise
 
 
@@ -459,9 +494,12 @@ def save_analysis_to_db(
     db.add(report)
     db.flush()  # ID를 얻기 위해 flush
     
-    # 뉴스 연결
-    for news in news_articles:
-        report.news_articles.append(news)
+    # 뉴스 연결 (연관 테이블에 한 번에 INSERT)
+    if news_articles:
+        db.execute(
+            pg_insert(report_news).on_conflict_do_nothing(),
+            [{"report_id": report.id, "news_id": article.id} for article in news_articles]
+        )
     
     # 산업 및 주식 저장
     for industry_data in analysis_result.get("industries", []):
@@ -560,17 +598,17 @@ def analyze_news_from_vector_db(
             start_datetime=start_datetime,
             end_datetime=end_datetime,
             query_embedding=query_embedding,
-            limit=20  # 상위 20개만 선택
+            limit=MAX_ANALYSIS_NEWS  # 상위 20개만 선택
         )
-        print(f"✅ 벡터 유사도 검색으로 {len(news_articles)}개 뉴스 선택")
+        logger.info("✅ 벡터 유사도 검색으로 %d개 뉴스 선택", len(news_articles))
     else:
         # 쿼리 임베딩 생성 실패 시 기존 방식 사용
-        print("⚠️  쿼리 임베딩 생성 실패, 날짜 범위 필터링만 사용")
+        logger.warning("⚠️  쿼리 임베딩 생성 실패, 날짜 범위 필터링만 사용")
         news_articles = get_news_by_date_range(
             db=db,
             start_datetime=start_datetime,
             end_datetime=end_datetime,
-            limit=20
+            limit=MAX_ANALYSIS_NEWS
         )
     
     if not news_articles:
@@ -579,6 +617,6 @@ def analyze_news_from_vector_db(
     # 분석 및 저장
     report = analyze_and_save(db, news_articles, analysis_date)
     
-    print(f"✅ 벡터 DB 기반 분석 완료: 보고서 ID={report.id}, 뉴스 {len(news_articles)}개 분석")
+    logger.info("✅ 벡터 DB 기반 분석 완료: 보고서 ID=%s, 뉴스 %d개 분석", report.id, len(news_articles))
     
     return report
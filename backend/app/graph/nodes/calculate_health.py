@@ -2,17 +2,13 @@
 Health Factor 계산 노드
 재무 데이터를 기반으로 각 회사의 health_factor를 계산합니다.
 """
+import logging
 from typing import Dict, Any
-import sys
-import os
-
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
 
 from app.graph.state import ReportGenerationState
 
+logger = logging.getLogger(__name__)
+
 
 def calculate_health_factor(state: ReportGenerationState, config: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -34,7 +30,7 @@ def calculate_health_factor(state: ReportGenerationState, config: Dict[str, Any]
     companies_by_industry = state.get("companies_by_industry", {})
     
     if not financial_data:
-        print("⚠️  재무 데이터가 없습니다.")
+        logger.warning("⚠️  재무 데이터가 없습니다.")
         return {
             "health_factors": {},
             "errors": state.get("errors", []) + ["재무 데이터가 없습니다."]
@@ -54,7 +50,7 @@ def calculate_health_factor(state: ReportGenerationState, config: Dict[str, Any]
                     "industry": industry_name
                 })
     
-    print(f"💊 Health Factor 계산 시작: {len(all_companies)}개 회사")
+    logger.info("💊 Health Factor 계산 시작: %d개 회사", len(all_companies))
     
     for company in all_companies:
         stock_code = company.get("stock_code")
@@ -136,9 +132,9 @@ def calculate_health_factor(state: ReportGenerationState, config: Dict[str, Any]
             }
         }
         
-        print(f"✅ {stock_name} ({stock_code}): Health Factor = {health_factor:.2f}")
+        logger.info("✅ %s (%s): Health Factor = %.2f", stock_name, stock_code, health_factor)
     
-    print(f"✅ Health Factor 계산 완료: {len(health_factors)}개 회사")
+    logger.info("✅ Health Factor 계산 완료: %d개 회사", len(health_factors))
     
     return {
         "health_factors": health_factors,
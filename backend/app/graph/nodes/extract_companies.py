@@ -2,20 +2,16 @@
 산업별 회사 목록 추출 노드
 각 산업군에 대해 관련 회사 목록을 추출합니다.
 """
+import logging
 from typing import Dict, Any, List
-import sys
-import os
 import json
 
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
 from app.graph.state import ReportGenerationState
 from app.analysis import get_openai_client
 from app.services.dart_api import get_dart_code_from_stock_code
 
+logger = logging.getLogger(__name__)
+
 
 def extract_companies(state: ReportGenerationState, config: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -31,7 +27,7 @@ def extract_companies(state: ReportGenerationState, config: Dict[str, Any] = Non
     selected_news = state.get("selected_news", [])
     
     if not predicted_industries:
-        print("⚠️  예측된 산업군이 없습니다.")
+        logger.warning("⚠️  예측된 산업군이 없습니다.")
         return {
             "companies_by_industry": {},
             "errors": state.get("errors", []) + ["예측된 산업군이 없습니다."]
@@ -121,10 +117,10 @@ def extract_companies(state: ReportGenerationState, config: Dict[str, Any] = Non
                             if resolved_dart_code:
                                 # 매핑 테이블에서 찾은 경우 보정
                                 dart_code = resolved_dart_code
-                                print(f"✅ {stock_name} ({stock_code}): dart_code를 매핑 테이블에서 조회하여 보정 ({dart_code})")
+                                logger.info("✅ %s (%s): dart_code를 매핑 테이블에서 조회하여 보정 (%s)", stock_name, stock_code, dart_code)
                             else:
                                 # 매핑 테이블에서도 찾을 수 없는 경우
-                                print(f"⚠️  {stock_name} ({stock_code}): dart_code를 찾을 수 없습니다. 빈 문자열로 저장됩니다.")
+                                logger.warning("⚠️  %s (%s): dart_code를 찾을 수 없습니다. 빈 문자열로 저장됩니다.", stock_name, stock_code)
                                 dart_code = ""
                         else:
                             # LLM이 제공한 dart_code가 유효한 경우 그대로 사용
@@ -137,20 +133,20 @@ def extract_companies(state: ReportGenerationState, config: Dict[str, Any] = Non
                             "reasoning": reasoning
                         })
                     else:
-                        print(f"⚠️  잘못된 종목코드 무시: {stock_code} (산업: {industry_name})")
+                        logger.warning("⚠️  잘못된 종목코드 무시: %s (산업: %s)", stock_code, industry_name)
                 
                 companies_by_industry[industry_name] = validated_companies
-                print(f"✅ {industry_name}: {len(validated_companies)}개 회사 추출")
+                logger.info("✅ %s: %d개 회사 추출", industry_name, len(validated_companies))
                 
             except json.JSONDecodeError as e:
-                print(f"⚠️  {industry_name} 회사 추출 결과 파싱 실패: {e}")
+                logger.warning("⚠️  %s 회사 추출 결과 파싱 실패: %s", industry_name, e)
                 companies_by_industry[industry_name] = []
             except Exception as e:
-                print(f"⚠️  {industry_name} 회사 추출 실패: {e}")
+                logger.warning("⚠️  %s 회사 추출 실패: %s", industry_name, e)
                 companies_by_industry[industry_name] = []
         
         total_companies = sum(len(companies) for companies in companies_by_industry.values())
-        print(f"✅ 회사 목록 추출 완료: 총 {total_companies}개 회사")
+        logger.info("✅ 회사 목록 추출 완료: 총 %s개 회사", total_companies)
         
         return {
             "companies_by_industry": companies_by_industry,
@@ -158,10 +154,8 @@ def extract_companies(state: ReportGenerationState, config: Dict[str, Any] = Non
         }
         
     except Exception as e:
-        import traceback
         error_msg = f"회사 목록 추출 실패: {str(e)}"
-        print(f"⚠️  {error_msg}")
-        print(traceback.format_exc())
+        logger.exception("⚠️  %s", error_msg)
         return {
             "companies_by_industry": {},
             "errors": state.get("errors", []) + [error_msg]
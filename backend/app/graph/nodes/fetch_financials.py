@@ -1,26 +1,21 @@
 """
 재무제표 조회 노드
 DB에서 먼저 조회하고, 없으면 DART API를 통해 각 회사의 재무제표를 조회합니다.
-1년 전부터 3년 전까지 순차적으로 조회합니다.
+1년 전부터 3년 전까지 순차적으로 조회하며, 연도별 DART API 호출은 여러 회사를 묶어 일괄 수행합니다.
 """
+import logging
 from typing import Dict, Any, Optional
-import sys
-import os
-import time
 from datetime import datetime
 
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
-from app.graph.state import ReportGenerationState
+from app.graph.state import ReportGenerationState, get_db_from_config
 from app.services.dart_api import (
-    get_financial_from_db,
-    save_financial_to_db,
-    get_financial_statements_by_year
+    get_financials_from_db_bulk,
+    save_financials_bulk,
+    get_financial_statements_by_year_batch
 )
 
+logger = logging.getLogger(__name__)
+
 
 def fetch_financial_data(state: ReportGenerationState, config: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -37,16 +32,14 @@ def fetch_financial_data(state: ReportGenerationState, config: Dict[str, Any] =
     companies_by_industry = state.get("companies_by_industry", {})
     
     if not companies_by_industry:
-        print("⚠️  회사 목록이 없습니다.")
+        logger.warning("⚠️  회사 목록이 없습니다.")
         return {
             "financial_data": {},
             "errors": state.get("errors", []) + ["회사 목록이 없습니다."]
         }
     
     # DB 세션 가져오기
-    db = None
-    if config and "db" in config:
-        db = config["db"]
+    db = get_db_from_config(config)
     
     financial_data = {}
     errors = state.get("errors", [])
@@ -62,7 +55,7 @@ def fetch_financial_data(state: ReportGenerationState, config: Dict[str, Any] =
                 "dart_code": company.get("dart_code")
             })
     
-    print(f"📊 재무제표 조회 시작: {len(all_companies)}개 회사")
+    logger.info("📊 재무제표 조회 시작: %d개 회사", len(all_companies))
     
     # 현재 연도 기준으로 1년 전, 2년 전, 3년 전 계산
     current_year = datetime.now().year
@@ -72,66 +65,107 @@ def fetch_financial_data(state: ReportGenerationState, config: Dict[str, Any] =
         str(current_year - 3)   # 3년 전
     ]
     
-    # 각 회사의 재무제표 조회
+    total = len(all_companies)
+    
+    # 조회 대상 회사 선별 (idx는 로그 표시용)
+    pending = []
     for idx, company in enumerate(all_companies, 1):
         stock_code = company.get("stock_code")
         dart_code = company.get("dart_code")
         stock_name = company.get("stock_name", "알 수 없음")
         
         if not dart_code:
-            print(f"⚠️  [{idx}/{len(all_companies)}] {stock_name} ({stock_code}): DART 코드 없음, 스킵")
+            logger.warning("⚠️  [%s/%s] %s (%s): DART 코드 없음, 스킵", idx, total, stock_name, stock_code)
             continue
         
         if not stock_code:
-            print(f"⚠️  [{idx}/{len(all_companies)}] {stock_name}: 종목코드 없음, 스킵")
+            logger.warning("⚠️  [%s/%s] %s: 종목코드 없음, 스킵", idx, total, stock_name)
             continue
         
-        try:
-            financials = None
-            found_year = None
-            
-            # 1년 전부터 3년 전까지 순차적으로 조회
-            for bsns_year in years_to_check:
-                # 1. DB에서 먼저 조회
-                if db:
-                    financials = get_financial_from_db(db, stock_code, dart_code, bsns_year)
-                    if financials:
-                        print(f"📦 [{idx}/{len(all_companies)}] {stock_name} ({stock_code}): DB에서 {bsns_year}년 재무제표 조회 성공")
-                        found_year = bsns_year
-                        break
-                
-                # 2. DB에 없으면 DART API 호출
-                if idx > 1:
-                    time.sleep(0.2)  # API 호출 간격 (초당 5회 제한 고려)
-                
-                financials = get_financial_statements_by_year(dart_code, bsns_year)
-                
-                if financials:
-                    print(f"🌐 [{idx}/{len(all_companies)}] {stock_name} ({stock_code}): DART API에서 {bsns_year}년 재무제표 조회 성공")
-                    found_year = bsns_year
-                    
-                    # 3. DB에 저장
-                    if db:
-                        save_success = save_financial_to_db(db, stock_code, dart_code, bsns_year, financials)
-                        if save_success:
-                            print(f"💾 [{idx}/{len(all_companies)}] {stock_name} ({stock_code}): {bsns_year}년 재무제표 DB 저장 완료")
-                    
-                    break
-            
+        pending.append((idx, stock_code, dart_code, stock_name))
+    
+    found_years = {}
+    
+    # 조회 대상 전체(회사 × 연도)의 DB 저장분을 한 번의 쿼리로 조회
+    stored_financials = get_financials_from_db_bulk(
+        db,
+        [
+            (stock_code, dart_code, bsns_year)
+            for _, stock_code, dart_code, _ in pending
+            for bsns_year in years_to_check
+        ]
+    ) if db else {}
+    
+    # 1년 전부터 3년 전까지 순차적으로 조회 (연도별로 아직 못 찾은 회사만 대상)
+    for bsns_year in years_to_check:
+        if not pending:
+            break
+        
+        # 1. DB에서 먼저 조회
+        api_targets = []
+        for entry in pending:
+            idx, stock_code, dart_code, stock_name = entry
+            financials = stored_financials.get((stock_code, dart_code, bsns_year))
             if financials:
+                logger.info("📦 [%s/%s] %s (%s): DB에서 %s년 재무제표 조회 성공", idx, total, stock_name, stock_code, bsns_year)
                 financial_data[stock_code] = financials
-                print(f"✅ [{idx}/{len(all_companies)}] {stock_name} ({stock_code}): 재무제표 조회 성공 ({found_year}년)")
+                found_years[stock_code] = bsns_year
             else:
-                print(f"⚠️  [{idx}/{len(all_companies)}] {stock_name} ({stock_code}): 재무제표 조회 실패 (1~3년 전 데이터 없음)")
-                # 실패해도 계속 진행
-                
-        except Exception as e:
-            error_msg = f"{stock_name} ({stock_code}) 재무제표 조회 중 오류: {str(e)}"
-            print(f"⚠️  [{idx}/{len(all_companies)}] {error_msg}")
-            errors.append(error_msg)
+                api_targets.append(entry)
+        
+        # 2. DB에 없으면 DART API로 일괄 조회 (요청 간격 제한은 dart_api에서 처리)
+        api_results = {}
+        if api_targets:
+            try:
+                api_results = get_financial_statements_by_year_batch(
+                    [dart_code for _, _, dart_code, _ in api_targets],
+                    bsns_year
+                )
+            except Exception as e:
+                error_msg = f"{bsns_year}년 재무제표 일괄 조회 중 오류: {str(e)}"
+                logger.warning("⚠️  %s", error_msg)
+                errors.append(error_msg)
+        
+        next_pending = []
+        rows_to_save = []
+        for entry in api_targets:
+            idx, stock_code, dart_code, stock_name = entry
+            financials = api_results.get(dart_code)
+            if not financials:
+                next_pending.append(entry)
+                continue
+            
+            logger.info("🌐 [%s/%s] %s (%s): DART API에서 %s년 재무제표 조회 성공", idx, total, stock_name, stock_code, bsns_year)
+            # 같은 dart_code를 가진 종목끼리 딕셔너리를 공유하지 않도록 복사
+            financial_data[stock_code] = dict(financials)
+            found_years[stock_code] = bsns_year
+            
+            rows_to_save.append({
+                "stock_code": stock_code,
+                "dart_code": dart_code,
+                "bsns_year": bsns_year,
+                "financial_data": financials
+            })
+        
+        # 3. 새로 조회한 재무제표를 한 번에 DB에 저장
+        if db and rows_to_save:
+            saved_count = save_financials_bulk(db, rows_to_save)
+            if saved_count:
+                logger.info("💾 %s년 재무제표 DB 저장 완료: %s개", bsns_year, saved_count)
+        
+        pending = next_pending
+    
+    for idx, company in enumerate(all_companies, 1):
+        stock_code = company.get("stock_code")
+        if stock_code in found_years:
+            logger.info("✅ [%s/%s] %s (%s): 재무제표 조회 성공 (%s년)", idx, total, company.get('stock_name', '알 수 없음'), stock_code, found_years[stock_code])
+    
+    for idx, stock_code, _, stock_name in pending:
+        # 실패해도 계속 진행
+        logger.warning("⚠️  [%s/%s] %s (%s): 재무제표 조회 실패 (1~3년 전 데이터 없음)", idx, total, stock_name, stock_code)
     
     success_count = len(financial_data)
-    print(f"✅ 재무제표 조회 완료: {success_count}/{len(all_companies)}개 성공")
+    logger.info("✅ 재무제표 조회 완료: %s/%d개 성공", success_count, len(all_companies))
     
     return {
         "financial_data": financial_data,
@@ -2,20 +2,16 @@
 날짜 범위 필터링 노드
 전날 6시부터 현재 시간까지의 뉴스를 조회합니다.
 """
+import logging
 from typing import Dict, Any
-import sys
-import os
 
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
-from app.graph.state import ReportGenerationState
+from app.graph.state import ReportGenerationState, get_db_from_config
 from app.analysis import get_news_by_date_range
 from datetime import datetime, timedelta
 import pytz
 
+logger = logging.getLogger(__name__)
+
 
 def filter_news_by_date(state: ReportGenerationState, config: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -29,7 +25,7 @@ def filter_news_by_date(state: ReportGenerationState, config: Dict[str, Any] = N
         업데이트된 상태
     """
     # config에서 db 가져오기
-    db = config.get("db") if config else None
+    db = get_db_from_config(config)
     if db is None:
         return {
             "errors": state.get("errors", []) + ["데이터베이스 세션이 없습니다."],
@@ -53,7 +49,7 @@ def filter_news_by_date(state: ReportGenerationState, config: Dict[str, Any] = N
     # 분석 대상 날짜의 23:59:59를 종료 시간으로 설정
     end_datetime = target_date_kst.replace(hour=23, minute=59, second=59, microsecond=999999)
     
-    print(f"📅 날짜 범위 필터링: {yesterday_6am.strftime('%Y-%m-%d %H:%M:%S')} ~ {end_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info("📅 날짜 범위 필터링: %s ~ %s", yesterday_6am.strftime('%Y-%m-%d %H:%M:%S'), end_datetime.strftime('%Y-%m-%d %H:%M:%S'))
     
     try:
         # 날짜 범위로 뉴스 조회
@@ -64,7 +60,7 @@ def filter_news_by_date(state: ReportGenerationState, config: Dict[str, Any] = N
             limit=None  # 모든 뉴스 조회
         )
         
-        print(f"✅ 날짜 범위 필터링 완료: {len(filtered_news)}개 뉴스 조회")
+        logger.info("✅ 날짜 범위 필터링 완료: %d개 뉴스 조회", len(filtered_news))
         
         return {
             "filtered_news": filtered_news,
@@ -72,7 +68,7 @@ def filter_news_by_date(state: ReportGenerationState, config: Dict[str, Any] = N
         }
     except Exception as e:
         error_msg = f"날짜 범위 필터링 실패: {str(e)}"
-        print(f"⚠️  {error_msg}")
+        logger.warning("⚠️  %s", error_msg)
         return {
             "filtered_news": [],
             "errors": state.get("errors", []) + [error_msg]
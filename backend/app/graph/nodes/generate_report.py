@@ -2,20 +2,16 @@
 보고서 생성 노드
 모든 정보를 종합하여 최종 보고서 데이터를 생성합니다.
 """
+import logging
 from typing import Dict, Any, List
-import sys
-import os
 import json
 import re
 
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
 from app.graph.state import ReportGenerationState
 from app.analysis import get_openai_client
 
+logger = logging.getLogger(__name__)
+
 
 def generate_report(state: ReportGenerationState, config: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -213,7 +209,7 @@ def generate_report(state: ReportGenerationState, config: Dict[str, Any] = None)
             # LLM이 생성한 회사 목록이 비어있거나 매칭된 회사가 없는 경우, 
             # companies_by_industry의 실제 회사 목록을 사용 (fallback)
             if not companies and industry_companies:
-                print(f"⚠️  {industry_name}: LLM이 생성한 회사 목록이 비어있거나 매칭되지 않아 실제 회사 목록을 사용합니다.")
+                logger.warning("⚠️  %s: LLM이 생성한 회사 목록이 비어있거나 매칭되지 않아 실제 회사 목록을 사용합니다.", industry_name)
                 for actual_company in industry_companies:
                     stock_code = actual_company.get("stock_code", "")
                     if stock_code:
@@ -238,7 +234,7 @@ def generate_report(state: ReportGenerationState, config: Dict[str, Any] = None)
                 "companies": companies
             })
         
-        print(f"✅ 보고서 생성 완료: {len(report_data['industries'])}개 산업, {len(selected_news)}개 뉴스")
+        logger.info("✅ 보고서 생성 완료: %d개 산업, %d개 뉴스", len(report_data['industries']), len(selected_news))
         
         return {
             "report_data": report_data,
@@ -247,16 +243,14 @@ def generate_report(state: ReportGenerationState, config: Dict[str, Any] = None)
         
     except json.JSONDecodeError as e:
         error_msg = f"보고서 생성 결과 파싱 실패: {str(e)}"
-        print(f"⚠️  {error_msg}")
+        logger.warning("⚠️  %s", error_msg)
         return {
             "report_data": {},
             "errors": state.get("errors", []) + [error_msg]
         }
     except Exception as e:
-        import traceback
         error_msg = f"보고서 생성 실패: {str(e)}"
-        print(f"⚠️  {error_msg}")
-        print(traceback.format_exc())
+        logger.exception("⚠️  %s", error_msg)
         return {
             "report_data": {},
             "errors": state.get("errors", []) + [error_msg]
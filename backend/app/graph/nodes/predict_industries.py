@@ -2,19 +2,15 @@
 산업군 예측 노드
 선별된 뉴스를 분석하여 유망한 산업군을 예측합니다.
 """
+import logging
 from typing import Dict, Any, List
-import sys
-import os
 import json
 
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
 from app.graph.state import ReportGenerationState
 from app.analysis import get_openai_client
 
+logger = logging.getLogger(__name__)
+
 
 def predict_industries(state: ReportGenerationState, config: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -30,7 +26,7 @@ def predict_industries(state: ReportGenerationState, config: Dict[str, Any] = No
     news_scores = state.get("news_scores", {})
     
     if not selected_news:
-        print("⚠️  선별된 뉴스가 없습니다.")
+        logger.warning("⚠️  선별된 뉴스가 없습니다.")
         return {
             "predicted_industries": [],
             "errors": state.get("errors", []) + ["선별된 뉴스가 없습니다."]
@@ -111,9 +107,9 @@ def predict_industries(state: ReportGenerationState, config: Dict[str, Any] = No
             
             # 디버깅: 원본 related_news_ids 로깅
             if not related_ids:
-                print(f"⚠️  산업 '{industry.get('industry_name')}'에 related_news_ids가 없습니다. LLM 응답: {industry}")
+                logger.warning("⚠️  산업 '%s'에 related_news_ids가 없습니다. LLM 응답: %s", industry.get('industry_name'), industry)
             elif not isinstance(related_ids, list):
-                print(f"⚠️  산업 '{industry.get('industry_name')}'의 related_news_ids가 리스트가 아닙니다. 타입: {type(related_ids)}, 값: {related_ids}")
+                logger.warning("⚠️  산업 '%s'의 related_news_ids가 리스트가 아닙니다. 타입: %s, 값: %s", industry.get('industry_name'), type(related_ids), related_ids)
             
             # 유효한 뉴스 ID만 유지
             if isinstance(related_ids, list):
@@ -123,11 +119,11 @@ def predict_industries(state: ReportGenerationState, config: Dict[str, Any] = No
             
             # 관련 뉴스가 없으면 제거하지 않고 경고만
             if not industry["related_news_ids"]:
-                print(f"⚠️  산업 '{industry.get('industry_name')}'에 관련 뉴스가 없습니다. (원본: {related_ids}, 유효한 ID: {valid_news_ids})")
+                logger.warning("⚠️  산업 '%s'에 관련 뉴스가 없습니다. (원본: %s, 유효한 ID: %s)", industry.get('industry_name'), related_ids, valid_news_ids)
         
-        print(f"✅ 산업군 예측 완료: {len(predicted_industries)}개 산업 예측")
+        logger.info("✅ 산업군 예측 완료: %d개 산업 예측", len(predicted_industries))
         for industry in predicted_industries:
-            print(f"   - {industry.get('industry_name')}: {len(industry.get('related_news_ids', []))}개 관련 뉴스")
+            logger.info("   - %s: %d개 관련 뉴스", industry.get('industry_name'), len(industry.get('related_news_ids', [])))
         
         return {
             "predicted_industries": predicted_industries,
@@ -136,16 +132,14 @@ def predict_industries(state: ReportGenerationState, config: Dict[str, Any] = No
         
     except json.JSONDecodeError as e:
         error_msg = f"산업군 예측 결과 파싱 실패: {str(e)}"
-        print(f"⚠️  {error_msg}")
+        logger.warning("⚠️  %s", error_msg)
         return {
             "predicted_industries": [],
             "errors": state.get("errors", []) + [error_msg]
         }
     except Exception as e:
-        import traceback
         error_msg = f"산업군 예측 실패: {str(e)}"
-        print(f"⚠️  {error_msg}")
-        print(traceback.format_exc())
+        logger.exception("⚠️  %s", error_msg)
         return {
             "predicted_industries": [],
             "errors": state.get("errors", []) + [error_msg]
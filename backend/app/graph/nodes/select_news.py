@@ -2,21 +2,148 @@
 뉴스 선별 및 점수화 노드
 Semantic Search와 LLM을 사용하여 주식 영향도가 높은 뉴스를 선별합니다.
 """
-from typing import Dict, Any, List
-import sys
-import os
+import logging
+from typing import Dict, Any, List, Tuple
 import json
+import hashlib
+import heapq
 
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
-from app.graph.state import ReportGenerationState
+from app.graph.state import ReportGenerationState, get_db_from_config
 from app.analysis import create_query_embedding, search_similar_news_by_embedding, get_openai_client
+from models.models import NewsImpactScore
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import insert
 from datetime import datetime, timedelta
 import pytz
 
+logger = logging.getLogger(__name__)
+
+# 점수화 LLM 설정
+SCORING_MODEL = "gpt-4o-mini"
+SCORING_SYSTEM_PROMPT = "당신은 주식 시장 분석 전문가입니다. 뉴스가 주식 시장에 미치는 영향을 정확하게 평가합니다."
+SCORING_PROMPT_TEMPLATE = """다음 뉴스 기사들이 주식 시장에 미치는 영향도를 평가해주세요.
+
+뉴스 기사:
+{news_items}
+
+각 뉴스는 <news id=뉴스ID>제목\n내용</news> 형식입니다.
+각 뉴스에 대해 다음 JSON 형식으로 응답해주세요:
+{{
+  "scores": [
+    {{
+      "news_id": int,
+      "score": float,  // 0.0-1.0 (1.0에 가까울수록 주식 시장에 큰 영향)
+      "reason": str  // 선별 이유 (간단히)
+    }}
+  ]
+}}
+
+점수 기준:
+- 0.9 이상: 매우 높은 영향 (기업 실적 발표, 정책 변화 등)
+- 0.7-0.9: 높은 영향 (산업 동향, M&A 등)
+- 0.5-0.7: 중간 영향 (일반적인 경제 뉴스)
+- 0.5 미만: 낮은 영향 (주식 시장과 직접적 관련 없음)"""
+
+# 뉴스 1건당 프롬프트 형식 (라벨 대신 태그로 감싸 토큰 수를 줄임)
+SCORING_ITEM_TEMPLATE = "<news id={id}>{title}\n{content}</news>"
+SCORING_CONTENT_PREVIEW_LENGTH = 300
+
+# 한 번의 LLM 호출로 평가할 뉴스 개수
+SCORING_BATCH_SIZE = 50
+
+# 프롬프트가 바뀌면 캐시된 점수가 자동으로 무효화되도록 해시를 캐시 키에 포함
+SCORING_PROMPT_SHA = hashlib.sha256(
+    (SCORING_SYSTEM_PROMPT + SCORING_PROMPT_TEMPLATE + SCORING_ITEM_TEMPLATE
+     + str(SCORING_CONTENT_PREVIEW_LENGTH)).encode("utf-8")
+).hexdigest()
+
+# 점수 캐시 유지 기간 (일)
+SCORE_CACHE_TTL_DAYS = 7
+
+
+def _load_cached_scores(db: Session, news_ids: List[int]) -> Dict[int, Tuple[float, str]]:
+    """
+    이미 평가된 뉴스의 점수를 캐시 테이블에서 조회합니다.
+    만료된(SCORE_CACHE_TTL_DAYS 경과) 캐시는 조회 대상에서 제외합니다 (삭제는 저장 시 수행).
+    
+    세션의 트랜잭션과 분리된 별도 커넥션을 사용하여,
+    commit/rollback으로 후보 뉴스 객체가 expire되지 않도록 합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        news_ids: 조회할 뉴스 ID 리스트
+        
+    Returns:
+        news_id -> (score, reason) 딕셔너리
+    """
+    if not news_ids:
+        return {}
+    
+    try:
+        cutoff = datetime.now() - timedelta(days=SCORE_CACHE_TTL_DAYS)
+        with db.get_bind().connect() as conn:
+            rows = conn.execute(
+                select(
+                    NewsImpactScore.news_id,
+                    NewsImpactScore.score,
+                    NewsImpactScore.reason
+                ).where(
+                    NewsImpactScore.news_id.in_(news_ids),
+                    NewsImpactScore.model == SCORING_MODEL,
+                    NewsImpactScore.prompt_sha == SCORING_PROMPT_SHA,
+                    NewsImpactScore.created_at >= cutoff
+                )
+            ).all()
+        
+        return {row.news_id: (row.score, row.reason) for row in rows}
+    except Exception as e:
+        logger.warning("⚠️  점수 캐시 조회 실패 (전체 재평가): %s", e)
+        return {}
+
+
+def _save_cached_scores(db: Session, scores: Dict[int, Tuple[float, str]]) -> None:
+    """
+    LLM으로 새로 평가한 점수를 캐시 테이블에 저장합니다 ((news_id, model, prompt_sha) 기준 upsert).
+    같은 트랜잭션에서 만료된(SCORE_CACHE_TTL_DAYS 경과) 캐시도 함께 삭제합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        scores: news_id -> (score, reason) 딕셔너리
+    """
+    if not scores:
+        return
+    
+    try:
+        cutoff = datetime.now() - timedelta(days=SCORE_CACHE_TTL_DAYS)
+        stmt = insert(NewsImpactScore).values([
+            {
+                "news_id": news_id,
+                "model": SCORING_MODEL,
+                "prompt_sha": SCORING_PROMPT_SHA,
+                "score": score,
+                "reason": reason
+            }
+            for news_id, (score, reason) in scores.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[NewsImpactScore.news_id, NewsImpactScore.model, NewsImpactScore.prompt_sha],
+            set_={
+                "score": stmt.excluded.score,
+                "reason": stmt.excluded.reason,
+                "created_at": func.now()
+            }
+        )
+        with db.get_bind().begin() as conn:
+            conn.execute(
+                delete(NewsImpactScore).where(NewsImpactScore.created_at < cutoff)
+            )
+            conn.execute(stmt)
+        logger.info("💾 점수 캐시 저장 완료: %d개", len(scores))
+    except Exception as e:
+        logger.warning("⚠️  점수 캐시 저장 실패: %s", e)
+
 
 def select_relevant_news(state: ReportGenerationState, config: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -29,7 +156,7 @@ def select_relevant_news(state: ReportGenerationState, config: Dict[str, Any] =
     Returns:
         업데이트된 상태
     """
-    db = config.get("db") if config else None
+    db = get_db_from_config(config)
     filtered_news = state.get("filtered_news", [])
     target_count = 20
     
@@ -42,7 +169,7 @@ def select_relevant_news(state: ReportGenerationState, config: Dict[str, Any] =
         }
     
     if not filtered_news:
-        print("⚠️  필터링된 뉴스가 없습니다.")
+        logger.warning("⚠️  필터링된 뉴스가 없습니다.")
         return {
             "selected_news": [],
             "news_scores": {},
@@ -62,7 +189,7 @@ def select_relevant_news(state: ReportGenerationState, config: Dict[str, Any] =
         query_embedding = create_query_embedding(query_text)
         
         if not query_embedding:
-            print("⚠️  쿼리 임베딩 생성 실패, 모든 뉴스를 후보로 사용")
+            logger.warning("⚠️  쿼리 임베딩 생성 실패, 모든 뉴스를 후보로 사용")
             candidate_news = filtered_news[:100]  # 최대 100개
         else:
             # 한국 시간대 설정
@@ -83,10 +210,10 @@ def select_relevant_news(state: ReportGenerationState, config: Dict[str, Any] =
                 end_datetime=end_datetime,
                 limit=100  # 후보는 더 많이 추출
             )
-            print(f"✅ Semantic Search로 {len(candidate_news)}개 후보 추출")
+            logger.info("✅ Semantic Search로 %d개 후보 추출", len(candidate_news))
         
         if not candidate_news:
-            print("⚠️  후보 뉴스가 없습니다.")
+            logger.warning("⚠️  후보 뉴스가 없습니다.")
             return {
                 "selected_news": [],
                 "news_scores": {},
@@ -97,7 +224,7 @@ def select_relevant_news(state: ReportGenerationState, config: Dict[str, Any] =
         # 2단계: LLM으로 각 뉴스의 주식 영향도 점수화
         client = get_openai_client()
         if not client:
-            print("⚠️  OpenAI 클라이언트를 사용할 수 없습니다. 후보 중 상위 N개 선택")
+            logger.warning("⚠️  OpenAI 클라이언트를 사용할 수 없습니다. 후보 중 상위 N개 선택")
             selected_news = candidate_news[:target_count]
             news_scores = {news.id: 0.5 for news in selected_news}
             selection_reasons = {news.id: "OpenAI API를 사용할 수 없어 자동 선택" for news in selected_news}
@@ -106,44 +233,37 @@ def select_relevant_news(state: ReportGenerationState, config: Dict[str, Any] =
             news_scores = {}
             selection_reasons = {}
             
-            # 뉴스를 배치로 나누어 처리 (한 번에 10개씩)
-            batch_size = 10
-            for i in range(0, len(candidate_news), batch_size):
-                batch = candidate_news[i:i + batch_size]
+            # 이전 실행에서 평가된 뉴스는 캐시된 점수를 사용
+            candidate_ids = {news.id for news in candidate_news}
+            cached_scores = _load_cached_scores(db, list(candidate_ids))
+            for news_id, (score, reason) in cached_scores.items():
+                news_scores[news_id] = score
+                selection_reasons[news_id] = reason
+            if cached_scores:
+                logger.info("📦 점수 캐시 적중: %d/%d개", len(cached_scores), len(candidate_news))
+            
+            uncached_news = [news for news in candidate_news if news.id not in cached_scores]
+            new_scores = {}
+            
+            # 뉴스를 배치로 나누어 처리 (한 번에 SCORING_BATCH_SIZE개씩)
+            batch_size = SCORING_BATCH_SIZE
+            for i in range(0, len(uncached_news), batch_size):
+                batch = uncached_news[i:i + batch_size]
                 
                 # 배치 프롬프트 생성
                 news_items = []
                 for news in batch:
-                    content_preview = news.content[:500] if news.content else "내용 없음"
-                    news_items.append(f"ID: {news.id}\n제목: {news.title}\n내용: {content_preview}")
+                    # 줄바꿈은 토큰만 차지하므로 공백으로 치환
+                    content_preview = news.content[:SCORING_CONTENT_PREVIEW_LENGTH].replace("\n", " ") if news.content else "내용 없음"
+                    news_items.append(SCORING_ITEM_TEMPLATE.format(id=news.id, title=news.title, content=content_preview))
                 
-                prompt = f"""다음 뉴스 기사들이 주식 시장에 미치는 영향도를 평가해주세요.
-
-뉴스 기사:
-{chr(10).join(news_items)}
-
-각 뉴스에 대해 다음 JSON 형식으로 응답해주세요:
-{{
-  "scores": [
-    {{
-      "news_id": int,
-      "score": float,  // 0.0-1.0 (1.0에 가까울수록 주식 시장에 큰 영향)
-      "reason": str  // 선별 이유 (간단히)
-    }}
-  ]
-}}
-
-점수 기준:
-- 0.9 이상: 매우 높은 영향 (기업 실적 발표, 정책 변화 등)
-- 0.7-0.9: 높은 영향 (산업 동향, M&A 등)
-- 0.5-0.7: 중간 영향 (일반적인 경제 뉴스)
-- 0.5 미만: 낮은 영향 (주식 시장과 직접적 관련 없음)"""
+                prompt = SCORING_PROMPT_TEMPLATE.format(news_items="\n".join(news_items))
                 
                 try:
                     response = client.chat.completions.create(
-                        model="gpt-4o-mini",
+                        model=SCORING_MODEL,
                         messages=[
-                            {"role": "system", "content": "당신은 주식 시장 분석 전문가입니다. 뉴스가 주식 시장에 미치는 영향을 정확하게 평가합니다."},
+                            {"role": "system", "content": SCORING_SYSTEM_PROMPT},
                             {"role": "user", "content": prompt}
                         ],
                         response_format={"type": "json_object"},
@@ -159,26 +279,30 @@ def select_relevant_news(state: ReportGenerationState, config: Dict[str, Any] =
                         reason = item.get("reason", "평가 완료")
                         news_scores[news_id] = score
                         selection_reasons[news_id] = reason
+                        if news_id in candidate_ids:
+                            new_scores[news_id] = (score, reason)
                     
-                    print(f"✅ 배치 {i//batch_size + 1} 처리 완료: {len(batch)}개 뉴스 평가")
+                    logger.info("✅ 배치 %s 처리 완료: %d개 뉴스 평가", i//batch_size + 1, len(batch))
                 except Exception as e:
-                    print(f"⚠️  배치 {i//batch_size + 1} 처리 실패: {e}")
+                    logger.warning("⚠️  배치 %s 처리 실패: %s", i//batch_size + 1, e)
                     # 실패한 뉴스는 기본 점수 부여
                     for news in batch:
                         if news.id not in news_scores:
                             news_scores[news.id] = 0.5
                             selection_reasons[news.id] = "평가 실패로 기본 점수 부여"
+            
+            # 실패로 기본 점수를 받은 뉴스는 다음 실행에서 재평가되도록 캐시하지 않음
+            _save_cached_scores(db, new_scores)
         
-        # 3단계: 점수 순으로 정렬하여 상위 N개 선택
-        scored_news = [(news, news_scores.get(news.id, 0.0)) for news in candidate_news if news.id in news_scores]
-        scored_news.sort(key=lambda x: x[1], reverse=True)
-        selected_news = [news for news, score in scored_news[:target_count]]
+        # 3단계: 점수 상위 N개 선택 (전체 정렬 대신 부분 선택)
+        scored_news = [news for news in candidate_news if news.id in news_scores]
+        selected_news = heapq.nlargest(target_count, scored_news, key=lambda news: news_scores[news.id])
         
         # 선택된 뉴스의 점수와 이유만 유지
         final_scores = {news.id: news_scores[news.id] for news in selected_news}
         final_reasons = {news.id: selection_reasons[news.id] for news in selected_news}
         
-        print(f"✅ 뉴스 선별 완료: {len(selected_news)}개 선택 (최고 점수: {max(final_scores.values()) if final_scores else 0:.2f})")
+        logger.info("✅ 뉴스 선별 완료: %d개 선택 (최고 점수: %.2f)", len(selected_news), max(final_scores.values()) if final_scores else 0)
         
         return {
             "selected_news": selected_news,
@@ -188,10 +312,8 @@ def select_relevant_news(state: ReportGenerationState, config: Dict[str, Any] =
         }
         
     except Exception as e:
-        import traceback
         error_msg = f"뉴스 선별 실패: {str(e)}"
-        print(f"⚠️  {error_msg}")
-        print(traceback.format_exc())
+        logger.exception("⚠️  %s", error_msg)
         return {
             "selected_news": [],
             "news_scores": {},
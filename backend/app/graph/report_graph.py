@@ -3,13 +3,6 @@ LangGraph 기반 보고서 생성 그래프
 """
 from langgraph.graph import StateGraph, END
 from typing import Dict, Any
-import sys
-import os
-
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
 
 from app.graph.state import ReportGenerationState
 from app.graph.nodes import (
@@ -23,32 +16,25 @@ from app.graph.nodes import (
 )
 
 
-def create_report_graph(db=None):
+def _build_graph() -> StateGraph:
     """
-    보고서 생성 그래프를 생성하고 컴파일합니다.
-    
-    Args:
-        db: 데이터베이스 세션 (노드에 전달하기 위해 사용)
+    보고서 생성 그래프의 노드와 엣지를 구성합니다.
+    데이터베이스 세션은 그래프 실행 시 config={"configurable": {"db": db}}로 전달되며,
+    각 노드는 (state, config) 시그니처로 이를 직접 받습니다.
     
     Returns:
-        컴파일된 LangGraph 그래프
+        컴파일 전 StateGraph
     """
-    # db를 바인딩한 노드 래퍼 생성
-    def make_node_wrapper(node_func):
-        def wrapper(state):
-            return node_func(state, config={"db": db})
-        return wrapper
-    
     workflow = StateGraph(ReportGenerationState)
     
-    # 노드 추가 (db 바인딩)
-    workflow.add_node("filter_news", make_node_wrapper(filter_news_by_date))
-    workflow.add_node("select_news", make_node_wrapper(select_relevant_news))
-    workflow.add_node("predict_industries", make_node_wrapper(predict_industries))
-    workflow.add_node("extract_companies", make_node_wrapper(extract_companies))
-    workflow.add_node("fetch_financials", make_node_wrapper(fetch_financial_data))
-    workflow.add_node("calculate_health", make_node_wrapper(calculate_health_factor))
-    workflow.add_node("generate_report", make_node_wrapper(generate_report))
+    # 노드 추가
+    workflow.add_node("filter_news", filter_news_by_date)
+    workflow.add_node("select_news", select_relevant_news)
+    workflow.add_node("predict_industries", predict_industries)
+    workflow.add_node("extract_companies", extract_companies)
+    workflow.add_node("fetch_financials", fetch_financial_data)
+    workflow.add_node("calculate_health", calculate_health_factor)
+    workflow.add_node("generate_report", generate_report)
     
     # 엣지 정의
     workflow.set_entry_point("filter_news")
@@ -60,4 +46,8 @@ def create_report_graph(db=None):
     workflow.add_edge("calculate_health", "generate_report")
     workflow.add_edge("generate_report", END)
     
-    return workflow.compile()
+    return workflow
+
+
+# 그래프 구조는 요청과 무관하므로 모듈 로드 시 한 번만 컴파일하여 재사용
+REPORT_GRAPH = _build_graph().compile()
@@ -3,17 +3,12 @@
 LangGraph 결과를 데이터베이스에 저장합니다.
 """
 from typing import Dict, List
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from datetime import date
-import sys
-import os
 
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
-from models.models import Report, ReportIndustry, ReportStock, NewsArticle
+from models.models import Report, ReportIndustry, ReportStock, NewsArticle, report_news
 
 
 def save_report_to_db(
@@ -44,37 +39,52 @@ def save_report_to_db(
     db.add(report)
     db.flush()  # ID를 얻기 위해 flush
     
-    # 뉴스 연결
-    for news in selected_news:
-        report.news_articles.append(news)
-    
-    # 산업 및 주식 저장
-    for industry_data in report_data.get("industries", []):
-        industry = ReportIndustry(
-            report_id=report.id,
-            industry_name=industry_data.get("industry_name", ""),
-            impact_level=industry_data.get("impact_level", "medium"),
-            impact_description=industry_data.get("impact_description", ""),
-            trend_direction=industry_data.get("trend_direction", "neutral"),
-            selection_reason=industry_data.get("selection_reason", "")
+    # 뉴스 연결 (연관 테이블에 한 번에 INSERT)
+    if selected_news:
+        db.execute(
+            pg_insert(report_news).on_conflict_do_nothing(),
+            [{"report_id": report.id, "news_id": news.id} for news in selected_news]
         )
-        db.add(industry)
-        db.flush()
+    
+    # 산업 저장 (한 번의 INSERT ... RETURNING으로 ID 획득)
+    industries_data = report_data.get("industries", [])
+    industry_rows = [
+        {
+            "report_id": report.id,
+            "industry_name": industry_data.get("industry_name", ""),
+            "impact_level": industry_data.get("impact_level", "medium"),
+            "impact_description": industry_data.get("impact_description", ""),
+            "trend_direction": industry_data.get("trend_direction", "neutral"),
+            "selection_reason": industry_data.get("selection_reason", "")
+        }
+        for industry_data in industries_data
+    ]
+    
+    if industry_rows:
+        industry_ids = db.execute(
+            insert(ReportIndustry).returning(ReportIndustry.id, sort_by_parameter_order=True),
+            industry_rows
+        ).scalars().all()
+        
+        # 주식 저장 (전체 산업의 주식을 한 번에 INSERT)
+        stock_rows = [
+            {
+                "report_id": report.id,
+                "industry_id": industry_id,
+                "stock_code": company_data.get("stock_code", ""),
+                "stock_name": company_data.get("stock_name", ""),
+                "expected_trend": "neutral",  # 기본값
+                "confidence_score": float(company_data.get("confidence_score", 0.5)),  # 기본값
+                "reasoning": company_data.get("reasoning", ""),
+                "health_factor": float(company_data.get("health_factor", 0.5)),
+                "dart_code": company_data.get("dart_code", "")
+            }
+            for industry_data, industry_id in zip(industries_data, industry_ids)
+            for company_data in industry_data.get("companies", [])
+        ]
         
-        # 주식 저장
-        for company_data in industry_data.get("companies", []):
-            stock = ReportStock(
-                report_id=report.id,
-                industry_id=industry.id,
-                stock_code=company_data.get("stock_code", ""),
-                stock_name=company_data.get("stock_name", ""),
-                expected_trend="neutral",  # 기본값
-                confidence_score=float(company_data.get("confidence_score", 0.5)),  # 기본값
-                reasoning=company_data.get("reasoning", ""),
-                health_factor=float(company_data.get("health_factor", 0.5)),
-                dart_code=company_data.get("dart_code", "")
-            )
-            db.add(stock)
+        if stock_rows:
+            db.execute(insert(ReportStock), stock_rows)
     
     db.commit()
     db.refresh(report)
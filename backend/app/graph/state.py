@@ -2,15 +2,8 @@
 LangGraph State 정의
 보고서 생성 프로세스의 상태를 관리합니다.
 """
-from typing import TypedDict, List, Dict, Optional
+from typing import TypedDict, List, Dict, Optional, Any
 from datetime import date, datetime
-import sys
-import os
-
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
 
 from models.models import NewsArticle
 
@@ -37,3 +30,19 @@ class ReportGenerationState(TypedDict, total=False):
     
     # 에러 처리
     errors: List[str]
+
+
+def get_db_from_config(config: Optional[Dict[str, Any]]):
+    """
+    LangGraph RunnableConfig에서 데이터베이스 세션을 꺼냅니다.
+    그래프 실행 시 config={"configurable": {"db": db}} 형태로 전달됩니다.
+    
+    Args:
+        config: 노드에 전달된 RunnableConfig
+        
+    Returns:
+        데이터베이스 세션 또는 None
+    """
+    if not config:
+        return None
+    return config.get("configurable", {}).get("db")
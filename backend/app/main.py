@@ -1,32 +1,48 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi import Depends, HTTPException, status
-from app.database import engine, Base
+from app.database import engine, Base, initialize_schema_with_lock
 from app.routers import health, analyze, reports, news, users
-from app.scheduler import start_scheduler, stop_scheduler
+from app.scheduler import start_scheduler, stop_scheduler, close_http_client
+import logging
+import logging.handlers
+import queue
 import secrets
-import sys
 import os
 
-# models 모듈 import (테이블 생성용)
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+# 로그 레코드는 큐에 넣기만 하고, 실제 stdout 출력은 별도 리스너 스레드가 담당
+# (여러 요청 스레드가 stdout을 두고 경합하지 않도록)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# QueueHandler.prepare()가 메시지를 미리 포맷하므로 본문만 남기고, 접두어는 리스너의 StreamHandler에서만 붙임
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+_root_logger = logging.getLogger()
+_root_logger.addHandler(_queue_handler)
+_root_logger.setLevel(LOG_LEVEL)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+_log_listener.start()
+
+logger = logging.getLogger(__name__)
+
+# models 모듈 import (테이블 생성용, backend 경로는 app 패키지 초기화 시 등록됨)
 from models import models
 
-# 데이터베이스 스키마 초기화 (서버 시작 시 자동으로 스키마 동기화)
-from app.database import initialize_schema
-initialize_schema()
-
 app = FastAPI(
     title="Stock Analysis API",
     version="1.0.0",
     docs_url=None,
     redoc_url=None,
-    openapi_url=None
+    openapi_url=None,
+    # 응답 직렬화는 orjson으로 처리 (표준 json 대비 인코딩 비용 절감)
+    default_response_class=ORJSONResponse
 )
 
 security = HTTPBasic()
@@ -67,7 +83,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "message": error["msg"],
             "type": error["type"]
         })
-    print(f"요청 검증 실패: {error_details}")
+    logger.warning("요청 검증 실패: %s", error_details)
     return JSONResponse(
         status_code=400,
         content={
@@ -92,15 +108,25 @@ if vercel_domains:
     domains = [domain.strip() for domain in vercel_domains.split(",") if domain.strip()]
     allowed_origins.extend(domains)
 
+# 중복 origin 제거 (순서 유지) - 요청마다 목록을 순회하므로 최소 크기로 유지
+allowed_origins = list(dict.fromkeys(allowed_origins))
+
+# Vercel 프리뷰 도메인처럼 목록으로 열거할 수 없는 origin은 정규식으로 허용
+# (예: CORS_ORIGIN_REGEX=https://.*\.vercel\.app)
+allowed_origin_regex = os.getenv("CORS_ORIGIN_REGEX") or None
+
 # 환경 변수로 모든 origin 허용 옵션 (개발용, 프로덕션에서는 사용하지 않음)
 allow_all_origins = os.getenv("CORS_ALLOW_ALL", "false").lower() == "true"
 if allow_all_origins:
     allowed_origins = ["*"]
+    allowed_origin_regex = None
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
-    allow_credentials=True,
+    allow_origin_regex=allowed_origin_regex,
+    # 와일드카드 origin과 credentials는 함께 사용할 수 없음 (프론트엔드는 쿠키를 보내지 않음)
+    allow_credentials=not allow_all_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -114,14 +140,18 @@ app.include_router(users.router, prefix="/api", tags=["users"])
 
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작 시 스케줄러 초기화"""
+    """앱 시작 시 데이터베이스 스키마 동기화 및 스케줄러 초기화"""
+    # 여러 워커가 동시에 DDL을 실행하지 않도록 advisory lock으로 직렬화
+    initialize_schema_with_lock()
     start_scheduler()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """앱 종료 시 스케줄러 중지"""
+    """앱 종료 시 스케줄러 중지, 공유 HTTP 클라이언트 및 로그 리스너 정리"""
     stop_scheduler()
+    await close_http_client()
+    _log_listener.stop()
 
 
 @app.get("/")
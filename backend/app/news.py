@@ -4,23 +4,33 @@
 """
 import json
 import os
-import sys
 import math
-import traceback
+import logging
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Optional
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
+import orjson
 import requests
+import tldextract
+from psycopg2.extras import execute_values
+from requests.adapters import HTTPAdapter
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from urllib3.util.retry import Retry
 
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
+from app.analysis import get_openai_client
 from models.models import NewsArticle
 
+logger = logging.getLogger(__name__)
+
 # ============================================================================
 # 상수 정의
 # ============================================================================
@@ -46,15 +56,52 @@ THENEWSAPI_MAX_SIZE = 50  # 기본 제한
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
 OPENAI_EMBEDDING_DIMENSION = 1536
+# 요청 1회당 입력 개수 (API 상한은 2048개지만 요청당 토큰 한도를 넘지 않도록 작게 유지)
+OPENAI_EMBEDDING_BATCH_SIZE = 100
+OPENAI_EMBEDDING_MAX_CONCURRENCY = 4  # 동시에 보낼 임베딩 요청 수 (rate limit 고려)
+MIN_EMBEDDING_CONTENT_LENGTH = 20  # 이보다 짧은 본문은 임베딩 생성 생략
 
 # 요청 타임아웃 (초)
 REQUEST_TIMEOUT = 10
 
-# 날짜 파싱 형식
-DATE_FORMAT_ISO = "%Y-%m-%dT%H:%M:%S"
-DATE_FORMAT_RFC2822 = "%a, %d %b %Y %H:%M:%S %z"
-DATE_FORMAT_RFC2822_NO_TZ = "%a, %d %b %Y %H:%M:%S"
-DATE_FORMAT_SIMPLE = "%Y-%m-%d %H:%M:%S"
+# Provider 응답 캐시: 같은 (provider, query, size) 요청을 짧은 시간 안에 반복하지 않도록 함
+NEWS_CACHE_TTL_SECONDS = 300
+NEWS_CACHE_MAX_ENTRIES = 256
+_PROVIDER_CACHE: Dict[Tuple[str, str, int], Tuple[float, List[dict]]] = {}
+_PROVIDER_CACHE_LOCK = threading.Lock()
+
+# 도메인 추출기 (패키지에 포함된 공개 접미사 목록만 사용해 첫 호출 시 네트워크 조회를 하지 않음)
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=())
+
+# 뉴스 API 호출용 공유 HTTP 세션 (Provider 간 TCP/TLS 연결 재사용)
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        # 연결 실패나 게이트웨이 오류(502/503/504) 등 일시적 오류는 짧은 backoff로 재시도
+        # (재시도 후에도 실패하면 마지막 응답을 그대로 돌려줘 raise_for_status에서 처리)
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
+    ),
+)
+_HTTP_SESSION.headers.update({"Accept-Encoding": "gzip"})
+
+# Naver API 응답의 검색어 강조 태그와 HTML 엔티티 → 치환 문자열
+_HTML_REPLACEMENTS = {
+    "<b>": "",
+    "</b>": "",
+    "&quot;": '"',
+    "&amp;": "&",
+    "&lt;": "<",
+    "&gt;": ">",
+}
+_HTML_PATTERN = re.compile("|".join(map(re.escape, _HTML_REPLACEMENTS)))
 
 # ============================================================================
 # 유틸리티 함수
@@ -74,30 +121,24 @@ def parse_datetime(date_str: str) -> Optional[datetime]:
     if not date_str:
         return None
     
-    # ISO 8601 형식 시도
-    try:
-        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-    except ValueError:
-        pass
-    
-    # RFC 2822 형식 시도 (타임존 포함)
-    try:
-        return datetime.strptime(date_str, DATE_FORMAT_RFC2822)
-    except ValueError:
-        pass
+    # 첫 글자로 형식을 판별하여 실패할 파서를 미리 건너뜀
+    # - 숫자로 시작: ISO 8601 또는 간단한 형식 ("2024-01-01T..." / "2024-01-01 ...")
+    # - 그 외: RFC 2822 (Naver pubDate, 예: "Mon, 01 Jan 2024 ...")
+    if date_str[0].isdigit():
+        try:
+            # Python 3.11+의 fromisoformat은 "Z" 접미사와 공백 구분자("2024-01-01 10:00:00")를 직접 처리
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
     
-    # RFC 2822 형식 시도 (타임존 없음)
+    # RFC 2822 형식 (요일 생략 시 숫자로 시작할 수 있으므로 마지막 시도로도 사용, 로케일 무관)
     try:
-        return datetime.strptime(date_str, DATE_FORMAT_RFC2822_NO_TZ)
-    except ValueError:
+        return parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
         pass
     
-    # 간단한 형식 시도
-    try:
-        return datetime.strptime(date_str, DATE_FORMAT_SIMPLE)
-    except ValueError:
-        print(f"⚠️  날짜 파싱 실패: {date_str}")
-        return None
+    logger.warning("⚠️  날짜 파싱 실패: %s", date_str)
+    return None
 
 
 def clean_html_tags(text: str) -> str:
@@ -113,20 +154,23 @@ def clean_html_tags(text: str) -> str:
     if not text:
         return ""
     
-    replacements = {
-        "<b>": "",
-        "</b>": "",
-        "&quot;": '"',
-        "&amp;": "&",
-        "&lt;": "<",
-        "&gt;": ">",
-    }
-    
-    cleaned = text
-    for old, new in replacements.items():
-        cleaned = cleaned.replace(old, new)
+    # 태그 제거와 엔티티 치환을 정규식 한 번의 스캔으로 처리
+    return _HTML_PATTERN.sub(lambda m: _HTML_REPLACEMENTS[m.group(0)], text)
+
+
+@lru_cache(maxsize=512)
+def _extract_domain_from_host(host: str) -> str:
+    """
+    호스트명에서 등록 도메인 이름을 추출합니다.
+    기사 URL은 매번 다르지만 언론사 호스트는 반복되므로 호스트 단위로 캐시합니다.
     
-    return cleaned
+    Args:
+        host: 호스트명 (예: www.chosun.com)
+        
+    Returns:
+        도메인 문자열 (예: chosun)
+    """
+    return _TLD_EXTRACT(host).domain
 
 
 def extract_domain_from_url(url: str) -> str:
@@ -143,9 +187,11 @@ def extract_domain_from_url(url: str) -> str:
         return ""
     
     try:
-        import tldextract
-        extracted = tldextract.extract(url)
-        return extracted.domain
+        host = urlsplit(url).hostname
+        if not host:
+            # 스킴이 없는 URL은 호스트를 분리할 수 없으므로 원문 그대로 추출
+            return _TLD_EXTRACT(url).domain
+        return _extract_domain_from_host(host)
     except Exception:
         return ""
 
@@ -165,22 +211,22 @@ def handle_api_error(e: Exception, api_name: str, response: Optional[requests.Re
     error_msg = f"{api_name} API 요청 실패: {str(e)}"
     
     if isinstance(e, requests.exceptions.HTTPError) and response:
-        print(f"{api_name} API HTTP 오류: {e}")
-        print(f"응답 상태 코드: {response.status_code}")
-        print(f"응답 헤더: {dict(response.headers)}")
+        logger.warning("%s API HTTP 오류: %s", api_name, e)
+        logger.debug("응답 상태 코드: %s", response.status_code)
+        logger.debug("응답 헤더: %s", response.headers)
         
         try:
             error_data = response.json()
-            print(f"응답 내용: {error_data}")
+            logger.debug("응답 내용: %s", error_data)
             
             # API별 에러 메시지 키 추출
             error_message = error_data.get("message") or error_data.get("errorMessage", "알 수 없는 오류")
             error_msg = f"{api_name} API 오류 ({response.status_code}): {error_message}"
         except Exception:
-            print(f"응답 내용: {response.text}")
+            logger.debug("응답 내용: %s", response.text)
             error_msg = f"{api_name} API 오류 ({response.status_code}): {response.text}"
     
-    print(f"Traceback: {traceback.format_exc()}")
+    logger.debug("%s API 오류 상세", api_name, exc_info=True)
     return ValueError(error_msg)
 
 
@@ -194,16 +240,8 @@ def get_raw_connection(db: Session):
     Returns:
         raw PostgreSQL connection 객체
     """
-    sqlalchemy_conn = db.connection()
-    
-    if hasattr(sqlalchemy_conn, 'connection'):
-        raw_conn = sqlalchemy_conn.connection
-        # SQLAlchemy 2.0+ 지원
-        if hasattr(raw_conn, 'driver_connection'):
-            raw_conn = raw_conn.driver_connection
-        return raw_conn
-    
-    return sqlalchemy_conn
+    # SQLAlchemy 2.0: Connection.connection → 풀 프록시, driver_connection → psycopg2 연결
+    return db.connection().connection.driver_connection
 
 
 def normalize_provider_name(provider_name: str) -> str:
@@ -260,13 +298,12 @@ def _make_api_request(
         ValueError: API 호출 실패 시
     """
     try:
-        print(f"📰 {provider_name} API 호출: params={params}")
-        response = requests.get(url, params=params, headers=headers, timeout=timeout)
-        print(f"요청 URL: {response.url}")
-        print(f"응답 상태 코드: {response.status_code}")
+        logger.debug("📰 %s API 호출: params=%s", provider_name, params)
+        response = _HTTP_SESSION.get(url, params=params, headers=headers, timeout=timeout)
+        logger.debug("요청 URL: %s, 응답 상태 코드: %s", response.url, response.status_code)
         
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
         
     except requests.exceptions.RequestException as e:
         response = getattr(e, 'response', None)
@@ -385,10 +422,9 @@ class NewsdataProvider(BaseNewsProvider):
         
         try:
             # 422 에러 특별 처리를 위해 직접 요청 처리
-            print(f"📰 {self.name} API 호출: query={query}, size={size}")
-            response = requests.get(NEWSDATA_API_URL, params=params, timeout=REQUEST_TIMEOUT)
-            print(f"요청 URL: {response.url}")
-            print(f"응답 상태 코드: {response.status_code}")
+            logger.debug("📰 %s API 호출: query=%s, size=%s", self.name, query, size)
+            response = _HTTP_SESSION.get(NEWSDATA_API_URL, params=params, timeout=REQUEST_TIMEOUT)
+            logger.debug("요청 URL: %s, 응답 상태 코드: %s", response.url, response.status_code)
             
             # 422 에러 특별 처리
             if response.status_code == 422:
@@ -402,7 +438,7 @@ class NewsdataProvider(BaseNewsProvider):
                     raise ValueError(f"newsdata.io API 파라미터 오류: {response.text}")
             
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if data.get("status") != "success":
                 error_message = data.get("message", "알 수 없는 오류")
@@ -410,7 +446,7 @@ class NewsdataProvider(BaseNewsProvider):
             
             results = data.get("results", [])
             total_results = data.get("totalResults", 0)
-            print(f"✅ API 응답 성공: 총 {total_results}개 결과, {len(results)}개 반환")
+            logger.debug("✅ API 응답 성공: 총 %s개 결과, %d개 반환", total_results, len(results))
             
             articles = []
             for item in results:
@@ -423,7 +459,7 @@ class NewsdataProvider(BaseNewsProvider):
                     published_at=published_at
                 ))
             
-            print(f"✅ 파싱된 뉴스 기사: {len(articles)}개")
+            logger.debug("✅ 파싱된 뉴스 기사: %d개", len(articles))
             return articles
             
         except requests.exceptions.RequestException as e:
@@ -480,7 +516,7 @@ class NaverProvider(BaseNewsProvider):
             
             items = data.get("items", [])
             total_results = data.get("total", 0)
-            print(f"✅ API 응답 성공: 총 {total_results}개 결과, {len(items)}개 반환")
+            logger.debug("✅ API 응답 성공: 총 %s개 결과, %d개 반환", total_results, len(items))
             
             articles = []
             for item in items:
@@ -502,7 +538,7 @@ class NaverProvider(BaseNewsProvider):
                     published_at=published_at
                 ))
             
-            print(f"✅ 파싱된 뉴스 기사: {len(articles)}개")
+            logger.debug("✅ 파싱된 뉴스 기사: %d개", len(articles))
             return articles
             
         except ValueError:
@@ -554,7 +590,7 @@ class NewsOrgProvider(BaseNewsProvider):
                 
             articles_data = data.get("articles", [])
             total_results = data.get("totalResults", 0)
-            print(f"✅ API 응답 성공: 총 {total_results}개 결과, {len(articles_data)}개 반환")
+            logger.debug("✅ API 응답 성공: 총 %s개 결과, %d개 반환", total_results, len(articles_data))
             
             articles = []
             for item in articles_data:
@@ -582,7 +618,7 @@ class NewsOrgProvider(BaseNewsProvider):
                     published_at=published_at
                 ))
             
-            print(f"✅ 파싱된 뉴스 기사: {len(articles)}개")
+            logger.debug("✅ 파싱된 뉴스 기사: %d개", len(articles))
             return articles
             
         except ValueError:
@@ -635,7 +671,7 @@ class TheNewsAPIProvider(BaseNewsProvider):
             articles_data = data.get("data", [])
             meta = data.get("meta", {})
             found = meta.get("found", 0)
-            print(f"✅ API 응답 성공: 총 {found}개 결과, {len(articles_data)}개 반환")
+            logger.debug("✅ API 응답 성공: 총 %s개 결과, %d개 반환", found, len(articles_data))
             
             articles = []
             for item in articles_data:
@@ -665,7 +701,7 @@ class TheNewsAPIProvider(BaseNewsProvider):
                     published_at=published_at
                 ))
             
-            print(f"✅ 파싱된 뉴스 기사: {len(articles)}개")
+            logger.debug("✅ 파싱된 뉴스 기사: %d개", len(articles))
             return articles
             
         except ValueError:
@@ -674,12 +710,14 @@ class TheNewsAPIProvider(BaseNewsProvider):
             raise ValueError(f"{self.name} API 요청 실패: {str(e)}")
 
 
-def get_default_providers() -> List[BaseNewsProvider]:
+@lru_cache(maxsize=1)
+def get_default_providers() -> Tuple[BaseNewsProvider, ...]:
     """
     활성화된 기본 뉴스 제공자 목록을 반환합니다.
+    API 키는 import 시점에 고정되고 Provider는 상태가 없으므로 최초 1회만 생성합니다.
     
     Returns:
-        활성화된 Provider 리스트
+        활성화된 Provider 튜플 (공유 객체이므로 수정하지 않음)
     """
     providers: List[BaseNewsProvider] = []
 
@@ -695,7 +733,7 @@ def get_default_providers() -> List[BaseNewsProvider]:
     if THENEWSAPI_API_KEY:
         providers.append(TheNewsAPIProvider())
 
-    return providers
+    return tuple(providers)
 
 
 # ============================================================================
@@ -706,6 +744,7 @@ def get_default_providers() -> List[BaseNewsProvider]:
 def create_embedding(text_content: str) -> Optional[List[float]]:
     """
     OpenAI Embedding API를 사용하여 텍스트의 벡터 임베딩을 생성합니다.
+    여러 건을 처리할 때는 create_embeddings_batch를 사용하세요.
     
     Args:
         text_content: 임베딩을 생성할 텍스트
@@ -713,38 +752,91 @@ def create_embedding(text_content: str) -> Optional[List[float]]:
     Returns:
         벡터 임베딩 리스트 (1536 차원) 또는 None (실패 시)
     """
-    if not OPENAI_API_KEY:
-        print("⚠️  OPENAI_API_KEY 환경 변수가 설정되지 않았습니다. 임베딩을 생성할 수 없습니다.")
-        return None
-    
     if not text_content or not text_content.strip():
-        print("⚠️  빈 텍스트로는 임베딩을 생성할 수 없습니다.")
+        logger.warning("⚠️  빈 텍스트로는 임베딩을 생성할 수 없습니다.")
         return None
     
-    try:
-        from openai import OpenAI
-        
-        client = OpenAI(api_key=OPENAI_API_KEY)
-        response = client.embeddings.create(
-            model=OPENAI_EMBEDDING_MODEL,
-            input=text_content.strip()
-        )
+    return create_embeddings_batch([text_content])[0]
+
+
+def _embed_chunk(chunk: List[Tuple[int, str]]) -> List[Tuple[int, List[float]]]:
+    """
+    OpenAI Embedding API를 한 번 호출하여 청크의 임베딩을 생성합니다.
+    
+    Args:
+        chunk: (원래 위치, 텍스트) 리스트
         
-        embedding = response.data[0].embedding
-        print(f"✅ 임베딩 생성 완료: {len(embedding)} 차원")
-        return embedding
+    Returns:
+        (원래 위치, 임베딩) 리스트 (차원이 맞지 않는 벡터는 제외)
+    """
+    response = get_openai_client().embeddings.create(
+        model=OPENAI_EMBEDDING_MODEL,
+        input=[text for _, text in chunk],
+        dimensions=OPENAI_EMBEDDING_DIMENSION
+    )
+    
+    results = []
+    # response.data[i].index는 해당 청크 입력에서의 위치
+    for data in response.data:
+        # vector(1536) 컬럼에 맞지 않는 벡터는 저장 단계에서 실패하므로 미리 걸러냄
+        if len(data.embedding) != OPENAI_EMBEDDING_DIMENSION:
+            logger.warning(
+                "⚠️  임베딩 차원 불일치: %d (기대값: %d)",
+                len(data.embedding), OPENAI_EMBEDDING_DIMENSION
+            )
+            continue
+        results.append((chunk[data.index][0], data.embedding))
+    return results
+
+
+def create_embeddings_batch(texts: List[str]) -> List[Optional[List[float]]]:
+    """
+    OpenAI Embedding API를 입력 OPENAI_EMBEDDING_BATCH_SIZE개 단위로 호출하여
+    여러 텍스트의 벡터 임베딩을 생성합니다.
+    청크가 여러 개면 동시에 요청하고, 실패한 청크는 해당 위치만 None으로 남깁니다.
+    
+    Args:
+        texts: 임베딩을 생성할 텍스트 리스트
         
-    except Exception as e:
-        print(f"⚠️  임베딩 생성 실패: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return None
+    Returns:
+        입력 순서와 동일한 임베딩 리스트 (빈 텍스트 또는 실패 시 해당 위치는 None)
+    """
+    embeddings: List[Optional[List[float]]] = [None] * len(texts)
+    
+    if not OPENAI_API_KEY:
+        logger.warning("⚠️  OPENAI_API_KEY 환경 변수가 설정되지 않았습니다. 임베딩을 생성할 수 없습니다.")
+        return embeddings
+    
+    # 빈 텍스트는 API 오류를 일으키므로 제외하고 원래 위치를 기억
+    targets = [(idx, text.strip()) for idx, text in enumerate(texts) if text and text.strip()]
+    if not targets:
+        return embeddings
+    
+    chunks = [
+        targets[start:start + OPENAI_EMBEDDING_BATCH_SIZE]
+        for start in range(0, len(targets), OPENAI_EMBEDDING_BATCH_SIZE)
+    ]
+    
+    num_embedded = 0
+    with ThreadPoolExecutor(max_workers=min(len(chunks), OPENAI_EMBEDDING_MAX_CONCURRENCY)) as executor:
+        futures = [executor.submit(_embed_chunk, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            try:
+                for idx, embedding in future.result():
+                    embeddings[idx] = embedding
+                    num_embedded += 1
+            except Exception as e:
+                logger.warning("⚠️  임베딩 일괄 생성 실패: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+    
+    logger.info("✅ 임베딩 일괄 생성 완료: %d/%d개", num_embedded, len(targets))
+    return embeddings
 
 
 def create_metadata(
     title: str,
     url: str,
     published_at: Optional[datetime],
-    collected_at: Optional[datetime]
+    collected_at_iso: str
 ) -> dict:
     """
     벡터 DB에 저장할 메타데이터를 생성합니다.
@@ -754,7 +846,7 @@ def create_metadata(
         title: 뉴스 기사 제목
         url: 뉴스 기사 URL
         published_at: 발행 날짜
-        collected_at: 수집 날짜
+        collected_at_iso: 수집 날짜 (ISO 형식 문자열, 배치 단위로 한 번만 포맷)
         
     Returns:
         메타데이터 딕셔너리
@@ -762,16 +854,12 @@ def create_metadata(
     metadata = {
         "title": title,
         "url": url,
+        "collected_at": collected_at_iso,
     }
     
     if published_at:
         metadata["published_date"] = published_at.isoformat()
     
-    if collected_at:
-        metadata["collected_at"] = collected_at.isoformat()
-    else:
-        metadata["collected_at"] = datetime.now().isoformat()
-    
     return metadata
 
 
@@ -780,83 +868,54 @@ def create_metadata(
 # ============================================================================
 
 
-def save_embedding_to_db(
-    db: Session,
-    article_id: int,
-    embedding: List[float],
-    metadata: dict,
-    commit: bool = False
-) -> None:
+def save_embeddings_bulk(db: Session, rows: List[Tuple[int, Optional[str], str]]) -> None:
     """
-    pgvector에 벡터 임베딩을 저장합니다.
+    여러 기사의 벡터 임베딩과 메타데이터를 UPDATE 한 번으로 pgvector에 저장합니다.
+    임베딩이 None인 행은 메타데이터만 갱신됩니다 (임베딩 생성 실패 시).
     
     Args:
-        db: 데이터베이스 세션
-        article_id: 뉴스 기사 ID
-        embedding: 벡터 임베딩 리스트
-        metadata: 메타데이터 딕셔너리
-        commit: 커밋 여부 (기본값: False, 트랜잭션을 외부에서 관리할 때 사용)
+        db: 데이터베이스 세션 (commit은 호출자가 관리)
+        rows: (article_id, 임베딩 문자열 "[...]" 또는 None, 메타데이터 JSON 문자열) 리스트
         
     Raises:
         Exception: 벡터 저장 실패 시
     """
+    if not rows:
+        return
+    
     try:
-        embedding_str = "[" + ",".join(map(str, embedding)) + "]"
-        metadata_json = json.dumps(metadata, ensure_ascii=False)
-        
         raw_conn = get_raw_connection(db)
         cursor = raw_conn.cursor()
         
         try:
-            cursor.execute("""
-                UPDATE news_articles 
-                SET embedding = %s::vector(1536),
-                    metadata = %s::jsonb
-                WHERE id = %s
-            """, (embedding_str, metadata_json, article_id))
-            
-            if commit:
-                raw_conn.commit()
-            
-            print(f"✅ 벡터 임베딩 저장 완료: article_id={article_id}")
+            execute_values(
+                cursor,
+                """
+                UPDATE news_articles
+                SET embedding = COALESCE(data.emb::vector(1536), news_articles.embedding),
+                    metadata = data.md::jsonb
+                FROM (VALUES %s) AS data(id, emb, md)
+                WHERE news_articles.id = data.id
+                """,
+                rows,
+                template="(%s, %s, %s)",
+                page_size=len(rows)
+            )
         finally:
             cursor.close()
+        
+        num_embedded = sum(1 for _, emb, _ in rows if emb is not None)
+        logger.info("✅ 벡터 임베딩 저장 완료: %d개 (메타데이터만 저장: %d개)", num_embedded, len(rows) - num_embedded)
             
     except Exception as e:
         error_msg = str(e)
         if "SQL:" in error_msg:
             error_msg = error_msg.split("SQL:")[0].strip()
         
-        print(f"⚠️  벡터 임베딩 저장 실패 (article_id={article_id}): {error_msg}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.warning("⚠️  벡터 임베딩 일괄 저장 실패: %s", error_msg, exc_info=logger.isEnabledFor(logging.DEBUG))
         raise
 
 
-def save_metadata_only(db: Session, article_id: int, metadata: dict) -> None:
-    """
-    메타데이터만 저장합니다 (임베딩 생성 실패 시 사용).
-    
-    Args:
-        db: 데이터베이스 세션
-        article_id: 뉴스 기사 ID
-        metadata: 메타데이터 딕셔너리
-    """
-    metadata_json = json.dumps(metadata, ensure_ascii=False)
-    raw_conn = get_raw_connection(db)
-    cursor = raw_conn.cursor()
-    
-    try:
-        cursor.execute("""
-            UPDATE news_articles 
-            SET metadata = %s::jsonb
-            WHERE id = %s
-        """, (metadata_json, article_id))
-    finally:
-        cursor.close()
-    
-    print(f"✅ 메타데이터 저장 완료 (임베딩 없음): article_id={article_id}")
-
-
 def save_news_to_db(db: Session, articles: List[dict]) -> List[NewsArticle]:
     """
     뉴스 기사를 데이터베이스에 저장합니다.
@@ -874,75 +933,78 @@ def save_news_to_db(db: Session, articles: List[dict]) -> List[NewsArticle]:
         Exception: 벡터 저장 실패 시 뉴스 기사 저장도 롤백됨
     """
     saved_articles = []
-    collected_at = datetime.now()
+    collected_at_iso = datetime.now().isoformat()  # 배치 전체에 같은 수집 시각 사용
     
     try:
         # 1단계: 뉴스 기사 저장 (아직 commit하지 않음)
+        # URL 중복은 news_articles.url 유니크 인덱스와 ON CONFLICT DO NOTHING으로 DB에서 원자적으로 걸러냄
+        # (같은 배치 안의 중복 URL은 미리 제거)
+        insert_rows = []
+        seen_urls = set()
         for article_data in articles:
             url = article_data.get("url")
-            if not url:
+            if not url or url in seen_urls:
                 continue
+            seen_urls.add(url)
             
-            # URL 기반 중복 체크
-            existing = db.query(NewsArticle).filter(NewsArticle.url == url).first()
-            if existing:
-                continue
-            
-            news_article = NewsArticle(
-                title=article_data.get("title", ""),
-                content=article_data.get("content", ""),
-                source=article_data.get("source", ""),
-                url=url,
-                published_at=article_data.get("published_at"),
-                provider=article_data.get("provider", "")  # API 제공자 정보
-            )
-            
-            db.add(news_article)
-            saved_articles.append(news_article)
-        
-        # flush하여 ID를 얻기 (아직 commit하지 않음)
-        db.flush()
+            insert_rows.append({
+                "title": article_data.get("title", ""),
+                "content": article_data.get("content", ""),
+                "source": article_data.get("source", ""),
+                "url": url,
+                "published_at": article_data.get("published_at"),
+                "provider": article_data.get("provider", ""),  # API 제공자 정보
+            })
         
-        # 저장된 객체에 ID 부여를 위해 refresh
-        for article in saved_articles:
-            db.refresh(article)
+        if insert_rows:
+            # 실제로 삽입된 행만 NewsArticle 객체로 반환됨 (기존 URL은 제외)
+            stmt = (
+                pg_insert(NewsArticle)
+                .values(insert_rows)
+                .on_conflict_do_nothing(index_elements=[NewsArticle.url])  # URL 중복만 무시 (다른 제약 위반은 그대로 에러)
+                .returning(NewsArticle)
+            )
+            saved_articles = list(db.scalars(stmt))
         
         # 2단계: 벡터 임베딩 생성 및 저장
+        # URL → 원본 데이터 (같은 URL이 여러 번 오면 첫 번째 것을 사용)
+        articles_by_url = {}
+        for a in articles:
+            articles_by_url.setdefault(a.get("url"), a)
+        
+        pending = []
         for article in saved_articles:
-            # 해당 article의 원본 데이터 찾기
-            article_data = next(
-                (a for a in articles if a.get("url") == article.url),
-                None
-            )
-            
+            article_data = articles_by_url.get(article.url)
             if not article_data:
                 continue
             
+            pending.append((article, article_data))
+        
+        # 임베딩 생성 (기사별 호출 대신 한 번에 요청)
+        # 내용이 너무 짧은 기사는 의미 있는 벡터가 나오지 않으므로 빈 문자열로 넘겨 메타데이터만 저장
+        contents = []
+        for _, article_data in pending:
+            content = (article_data.get("content") or "").strip()
+            contents.append(content if len(content) >= MIN_EMBEDDING_CONTENT_LENGTH else "")
+        embeddings = create_embeddings_batch(contents)
+        
+        rows = []
+        for (article, article_data), embedding in zip(pending, embeddings):
             metadata = create_metadata(
                 title=article_data.get("title", ""),
                 url=article_data.get("url", ""),
                 published_at=article_data.get("published_at"),
-                collected_at=collected_at
+                collected_at_iso=collected_at_iso
             )
-            
-            # 임베딩 생성
-            content = article_data.get("content", "")
-            embedding = create_embedding(content)
-            
-            if embedding:
-                save_embedding_to_db(
-                    db=db,
-                    article_id=article.id,
-                    embedding=embedding,
-                    metadata=metadata,
-                    commit=False
-                )
-            else:
-                save_metadata_only(db, article.id, metadata)
+            # pgvector 텍스트 형식 "[v1,v2,...]"은 JSON 배열과 같으므로 C로 구현된 json 인코더 사용
+            embedding_str = json.dumps(embedding, separators=(",", ":")) if embedding else None
+            rows.append((article.id, embedding_str, orjson.dumps(metadata).decode()))
+        
+        save_embeddings_bulk(db, rows)
         
         # 3단계: 모든 작업이 성공하면 commit
         db.commit()
-        print(f"✅ 뉴스 수집 및 벡터 저장 완료: {len(saved_articles)}개 저장됨")
+        logger.info("✅ 뉴스 수집 및 벡터 저장 완료: %d개 저장됨", len(saved_articles))
         return saved_articles
         
     except Exception as e:
@@ -950,9 +1012,68 @@ def save_news_to_db(db: Session, articles: List[dict]) -> List[NewsArticle]:
         error_msg = str(e)
         if "SQL:" in error_msg:
             error_msg = error_msg.split("SQL:")[0].strip()
-        print(f"⚠️  뉴스 저장 실패 (전체 롤백): {error_msg}")
+        logger.warning("⚠️  뉴스 저장 실패 (전체 롤백): %s", error_msg)
         raise
 
+@lru_cache(maxsize=128)
+def _transform_query(queries: Tuple[str, ...], supports_or: bool) -> str:
+    """
+    Provider 특성에 따라 검색 쿼리를 변환합니다.
+    OR 연산자를 지원하면 모든 쿼리를 OR로 연결하고, 아니면 맨 앞의 쿼리만 사용합니다.
+    
+    Args:
+        queries: 검색 쿼리 튜플 (캐시 키로 쓰기 위해 튜플)
+        supports_or: Provider의 OR 연산자 지원 여부
+        
+    Returns:
+        변환된 쿼리 문자열
+    """
+    if supports_or:
+        return " OR ".join(queries)
+    return queries[0]
+
+
+def _get_cached_provider_articles(key: Tuple[str, str, int]) -> Optional[List[dict]]:
+    """
+    TTL이 지나지 않은 Provider 응답 캐시를 조회합니다.
+    
+    Args:
+        key: (Provider 이름, 변환된 쿼리, 요청 개수)
+        
+    Returns:
+        캐시된 기사 리스트의 복사본 또는 None (없거나 만료된 경우)
+    """
+    with _PROVIDER_CACHE_LOCK:
+        entry = _PROVIDER_CACHE.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, articles = entry
+        if expires_at <= time.monotonic():
+            del _PROVIDER_CACHE[key]
+            return None
+    
+    # 호출자가 기사 dict를 수정해도 캐시가 오염되지 않도록 복사본 반환
+    return [dict(article) for article in articles]
+
+
+def _set_cached_provider_articles(key: Tuple[str, str, int], articles: List[dict]) -> None:
+    """
+    Provider 응답을 TTL 캐시에 저장합니다. 최대 개수를 넘으면 가장 오래된 항목부터 제거합니다.
+    
+    Args:
+        key: (Provider 이름, 변환된 쿼리, 요청 개수)
+        articles: 저장할 기사 리스트
+    """
+    snapshot = [dict(article) for article in articles]
+    with _PROVIDER_CACHE_LOCK:
+        _PROVIDER_CACHE.pop(key, None)
+        _PROVIDER_CACHE[key] = (time.monotonic() + NEWS_CACHE_TTL_SECONDS, snapshot)
+        while len(_PROVIDER_CACHE) > NEWS_CACHE_MAX_ENTRIES:
+            # dict는 삽입 순서를 유지하므로 첫 항목이 가장 오래된 항목
+            del _PROVIDER_CACHE[next(iter(_PROVIDER_CACHE))]
+
+
 def _fetch_from_provider_safe(
     provider: BaseNewsProvider, 
     queries: List[str], 
@@ -969,31 +1090,37 @@ def _fetch_from_provider_safe(
     Returns:
         수집된 뉴스 기사 리스트 (실패 시 빈 리스트)
     """
-    # Provider 특성에 따른 쿼리 변환
-    if provider.supports_or:
-        transformed_query = " OR ".join(queries)
-    else:
-        transformed_query = queries[0]
+    transformed_query = _transform_query(tuple(queries), provider.supports_or)
+    
+    cache_key = (provider.name, transformed_query, size)
+    cached_articles = _get_cached_provider_articles(cache_key)
+    if cached_articles is not None:
+        logger.info("♻️  %s 캐시 사용: query=%s, %d개", provider.name, transformed_query, len(cached_articles))
+        return cached_articles
     
     try:
-        print(f"▶ 뉴스 수집: provider={provider.name}, query={transformed_query}, target_size={size} (Fair Share)")
+        logger.info("▶ 뉴스 수집: provider=%s, query=%s, target_size=%d", provider.name, transformed_query, size)
         provider_articles = provider.fetch(query=transformed_query, size=size)
 
         # Provider 이름을 정규화하고 각 article에 추가
-        provider_name_normalized = normalize_provider_name(provider.name)
+        provider_name = provider.name
+        provider_name_normalized = normalize_provider_name(provider_name)
         
         for article in provider_articles:
             article["provider"] = provider_name_normalized
             if not article.get("source"):
-                article["source"] = provider.name
+                article["source"] = provider_name
         
         num_fetched = len(provider_articles)
-        print(f"✅ {provider.name}에서 {num_fetched}개 기사를 가져왔습니다.")
+        logger.info("✅ %s에서 %d개 기사를 가져왔습니다.", provider.name, num_fetched)
+        
+        if provider_articles:
+            _set_cached_provider_articles(cache_key, provider_articles)
         return provider_articles
         
     except Exception as e:
         # 개별 Provider 실패는 로그만 남기고 계속 진행
-        print(f"⚠️  뉴스 제공자 '{provider.name}' 수집 실패: {e}")
+        logger.warning("⚠️  뉴스 제공자 '%s' 수집 실패: %s", provider.name, e)
         return []
 
 
@@ -1042,19 +1169,34 @@ def collect_news(db: Session, query: str = "주식", size: int = 10) -> List[New
         collected_articles: List[dict] = []
         
         # 모든 Provider에서 가능한 최대 개수 수집
+        # 네트워크 I/O 대기 시간이 대부분이므로 Provider별 요청을 스레드로 동시에 보냄
+        results_by_provider: Dict[BaseNewsProvider, List[dict]] = {}
+        with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+            futures = {
+                executor.submit(
+                    _fetch_from_provider_safe,
+                    provider=provider,
+                    queries=queries,
+                    size=provider.max_size,  # 각 Provider의 최대 한도만큼 요청
+                ): provider
+                for provider in providers
+            }
+            for future in as_completed(futures):
+                provider = futures[future]
+                try:
+                    results_by_provider[provider] = future.result()
+                except Exception as e:
+                    logger.warning("⚠️  뉴스 제공자 '%s' 수집 실패: %s", provider.name, e)
+
+        # 완료 순서와 무관하게 Provider 순서대로 합쳐서 URL 중복 제거 결과를 일정하게 유지
+        # 여러 Provider에 같은 기사(URL)가 있으면 먼저 나온 것만 DB 저장 단계로 넘김
+        seen_urls = set()
         for provider in providers:
-            # 각 Provider의 최대 한도만큼 요청
-            allocated_size = provider.max_size
-            
-            # Provider에서 뉴스 수집
-            provider_articles = _fetch_from_provider_safe(
-                provider=provider,
-                queries=queries,
-                size=allocated_size
-            )
-            
-            if provider_articles:
-                collected_articles.extend(provider_articles)
+            for article in results_by_provider.get(provider) or []:
+                url = article.get("url")
+                if url and url not in seen_urls:
+                    seen_urls.add(url)
+                    collected_articles.append(article)
 
         if not collected_articles:
             raise ValueError(
@@ -1066,14 +1208,13 @@ def collect_news(db: Session, query: str = "주식", size: int = 10) -> List[New
         # 이미 중복된 뉴스가 제외될 수 있으므로, 최종 반환된 저장 뉴스 개수가 size보다 적을 수 있음
         saved_articles = save_news_to_db(db, collected_articles)
 
-        print(f"✅ 뉴스 수집 완료 (멀티 Provider): {len(saved_articles)}개 최종 저장됨")
+        logger.info("✅ 뉴스 수집 완료 (멀티 Provider): %d개 최종 저장됨", len(saved_articles))
         return saved_articles
         
     except ValueError:
         raise
     except Exception as e:
-        print(f"⚠️  뉴스 수집 중 예상치 못한 오류: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("⚠️  뉴스 수집 중 예상치 못한 오류: %s", e)
         raise ValueError(f"뉴스 수집 실패: {str(e)}")
 
 
@@ -1093,7 +1234,7 @@ def delete_old_news(db: Session, days: int = 30) -> int:
         
     try:
         cutoff_date = datetime.now() - timedelta(days=days)
-        print(f"🗑️ 뉴스 삭제 시작: {days}일 이상 지난 기사 (기준일: {cutoff_date})")
+        logger.info("🗑️ 뉴스 삭제 시작: %d일 이상 지난 기사 (기준일: %s)", days, cutoff_date)
         
         # 삭제할 기사 수 조회 (로깅용)
         count = db.query(NewsArticle).filter(NewsArticle.published_at < cutoff_date).count()
@@ -1102,14 +1243,13 @@ def delete_old_news(db: Session, days: int = 30) -> int:
             # 일괄 삭제 execution
             db.query(NewsArticle).filter(NewsArticle.published_at < cutoff_date).delete(synchronize_session=False)
             db.commit()
-            print(f"✅ {count}개의 오래된 뉴스 기사가 삭제되었습니다.")
+            logger.info("✅ %d개의 오래된 뉴스 기사가 삭제되었습니다.", count)
         else:
-            print("ℹ️ 삭제할 오래된 뉴스 기사가 없습니다.")
+            logger.info("ℹ️ 삭제할 오래된 뉴스 기사가 없습니다.")
             
         return count
         
     except Exception as e:
         db.rollback()
-        print(f"⚠️  뉴스 삭제 중 오류 발생: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("⚠️  뉴스 삭제 중 오류 발생: %s", e)
         raise
@@ -0,0 +1,58 @@
+"""
+보고서 조회 응답 캐시 (프로세스 로컬)
+보고서 조회 라우터가 캐시를 채우고, 보고서 저장/뉴스 정리 시 다른 라우터가 캐시를 비웁니다.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+REPORT_CACHE_MAX_ENTRIES = 256
+_REPORT_CACHE: Dict[str, Tuple[float, Any]] = {}
+_REPORT_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_response(key: str) -> Optional[Any]:
+    """
+    TTL이 지나지 않은 캐시된 응답을 조회합니다.
+    
+    Args:
+        key: 캐시 키
+        
+    Returns:
+        캐시된 응답(모델 또는 JSON 바이트) 또는 None (없거나 만료된 경우)
+    """
+    with _REPORT_CACHE_LOCK:
+        entry = _REPORT_CACHE.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del _REPORT_CACHE[key]
+            return None
+        return response
+
+
+def set_cached_response(key: str, response: Any, ttl_seconds: int) -> None:
+    """
+    응답을 TTL 캐시에 저장합니다. 최대 개수를 넘으면 가장 오래된 항목부터 제거합니다.
+    
+    Args:
+        key: 캐시 키
+        response: 저장할 응답 (DB 세션과 무관한 Pydantic 객체 또는 직렬화된 JSON 바이트)
+        ttl_seconds: 유지 시간 (초)
+    """
+    with _REPORT_CACHE_LOCK:
+        _REPORT_CACHE.pop(key, None)
+        _REPORT_CACHE[key] = (time.monotonic() + ttl_seconds, response)
+        while len(_REPORT_CACHE) > REPORT_CACHE_MAX_ENTRIES:
+            # dict는 삽입 순서를 유지하므로 첫 항목이 가장 오래된 항목
+            del _REPORT_CACHE[next(iter(_REPORT_CACHE))]
+
+
+def clear_report_cache() -> None:
+    """
+    새 보고서가 저장되거나 오래된 뉴스가 삭제되었을 때 조회 결과에 바로 반영되도록 캐시를 비웁니다.
+    """
+    with _REPORT_CACHE_LOCK:
+        _REPORT_CACHE.clear()
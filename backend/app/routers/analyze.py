@@ -2,46 +2,81 @@
 분석 API 라우터
 뉴스 수집 및 AI 분석을 트리거하는 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field, ValidationError, field_validator, ConfigDict
-from datetime import date, datetime
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Optional
 from app.database import get_db
-from app.news import collect_news
-from app.graph.report_graph import create_report_graph
+from app.graph.report_graph import REPORT_GRAPH
 from app.graph.save_report import save_report_to_db
 from app.graph.state import ReportGenerationState
-from datetime import datetime, timedelta
+from app.report_cache import clear_report_cache
+import logging
 import pytz
-import httpx
-import sys
-import os
+import re
 
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
-from models.models import NewsArticle, Report
+# models는 app과 같은 backend 루트에 있으므로 sys.path 조작 없이 import
+from models.models import Report
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
+# 한국 시간대 (요청마다 조회하지 않도록 모듈 로드 시 한 번만 생성)
+SEOUL_TZ = pytz.timezone('Asia/Seoul')
+
+# 분석 완료된 날짜 → 보고서 ID (프로세스 로컬 캐시)
+# 보고서 삭제 API가 없으므로 한 번 확인된 날짜는 다시 DB에 묻지 않음 (미스는 항상 DB로 확인)
+_analyzed_report_ids: Dict[date, int] = {}
+
+# YYYY-MM-DD 날짜 형식 (strptime의 포맷 해석 비용 없이 파싱)
+_DATE_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+
+@lru_cache(maxsize=1024)
+def parse_date_string(value: str) -> date:
+    """
+    YYYY-MM-DD 형식 문자열을 date로 변환합니다.
+    같은 날짜 문자열이 반복해서 들어오므로 결과를 캐시합니다.
+    
+    Args:
+        value: YYYY-MM-DD 형식 날짜 문자열
+    
+    Returns:
+        변환된 date 객체
+    
+    Raises:
+        ValueError: 형식이 다르거나 존재하지 않는 날짜인 경우
+    """
+    # 길이/구분자만으로 걸러지는 잘못된 입력은 정규식까지 가지 않고 바로 거절
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise ValueError(f"YYYY-MM-DD 형식이 아닙니다: '{value}'")
+    
+    match = _DATE_PATTERN.fullmatch(value)
+    if match is None:
+        raise ValueError(f"YYYY-MM-DD 형식이 아닙니다: '{value}'")
+    year, month, day = map(int, match.groups())
+    return date(year, month, day)
+
 
 class AnalyzeRequest(BaseModel):
     """분석 요청 모델 - 벡터 DB에서 뉴스를 조회하여 분석"""
     model_config = ConfigDict(
-        json_schema_extra=lambda schema: schema.update({
+        json_schema_extra={
             "example": {
-                "date": date.today().strftime("%Y-%m-%d"),
+                "date": "2025-01-15",
                 "force": False
             }
-        })
+        }
     )
     
     date: str = Field(
         ...,
-        description=f"YYYY-MM-DD 형식의 분석 날짜 (예: {date.today().strftime('%Y-%m-%d')}). 필수값입니다."
+        description="YYYY-MM-DD 형식의 분석 날짜 (예: 2025-01-15). 필수값입니다."
     )
     force: bool = Field(False, description="이미 분석된 날짜도 재분석할지 여부", examples=[False, True])
     
@@ -61,7 +96,7 @@ class AnalyzeRequest(BaseModel):
         
         # 날짜 형식 검증
         try:
-            datetime.strptime(v, "%Y-%m-%d")
+            parse_date_string(v)
             return v
         except ValueError:
             raise ValueError(f"날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용해주세요. (받은 값: '{v}')")
@@ -75,6 +110,36 @@ class AnalyzeResponse(BaseModel):
     news_count: int
 
 
+def _analyze_response(report_id: int, status: str, message: str, news_count: int) -> ORJSONResponse:
+    """
+    AnalyzeResponse 스키마와 같은 형태의 응답을 바로 직렬화하여 반환합니다.
+    서버에서 만든 신뢰할 수 있는 값이므로, Response 객체를 반환해 FastAPI의 response_model
+    재검증/직렬화 단계를 건너뜁니다. (response_model은 OpenAPI 문서용으로 유지)
+    """
+    return ORJSONResponse({
+        "report_id": report_id,
+        "status": status,
+        "message": message,
+        "news_count": news_count
+    })
+
+
+def _find_report_id(db: Session, analysis_date: date) -> Optional[int]:
+    """
+    해당 날짜의 보고서 ID를 조회합니다. 존재 여부만 필요하므로 id만 조회합니다 (analysis_date 인덱스 사용).
+    
+    Args:
+        db: 데이터베이스 세션
+        analysis_date: 분석 날짜
+        
+    Returns:
+        보고서 ID 또는 None (없는 경우)
+    """
+    return db.query(Report.id).filter(
+        Report.analysis_date == analysis_date
+    ).limit(1).scalar()
+
+
 @router.post("/analyze", response_model=AnalyzeResponse)
 async def analyze_news(
     request: AnalyzeRequest,
@@ -86,15 +151,15 @@ async def analyze_news(
     """
     try:
         # 요청 로깅
-        print(f"분석 요청 받음: date={request.date}, force={request.force}")
+        logger.info("분석 요청 받음: date=%s, force=%s", request.date, request.force)
         
         # 날짜 파싱 (필수값이므로 항상 존재)
         date_str = request.date.strip()
         try:
-            analysis_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            print(f"날짜 파싱 성공: {analysis_date}")
+            analysis_date = parse_date_string(date_str)
+            logger.debug("날짜 파싱 성공: %s", analysis_date)
         except ValueError as e:
-            print(f"날짜 파싱 실패: '{date_str}' - {e}")
+            logger.warning("날짜 파싱 실패: '%s' - %s", date_str, e)
             raise HTTPException(
                 status_code=400,
                 detail=f"날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용해주세요. (받은 값: '{date_str}')"
@@ -102,37 +167,35 @@ async def analyze_news(
         
         # 이미 분석된 날짜인지 확인
         if not request.force:
-            existing_report = db.query(Report).filter(
-                Report.analysis_date == analysis_date
-            ).first()
+            existing_report_id = _analyzed_report_ids.get(analysis_date)
+            if existing_report_id is None:
+                # 커넥션 풀 대기/쿼리가 이벤트 루프를 막지 않도록 스레드풀에서 조회
+                existing_report_id = await run_in_threadpool(_find_report_id, db, analysis_date)
+                if existing_report_id is not None:
+                    _analyzed_report_ids[analysis_date] = existing_report_id
             
-            if existing_report:
-                return AnalyzeResponse(
-                    report_id=existing_report.id,
+            if existing_report_id is not None:
+                return _analyze_response(
+                    report_id=existing_report_id,
                     status="already_exists",
                     message=f"{analysis_date}에 대한 보고서가 이미 존재합니다. force=true로 재분석할 수 있습니다.",
                     news_count=0
                 )
         
-        # 한국 시간대 설정
-        seoul_tz = pytz.timezone('Asia/Seoul')
-        
-        # 분석 대상 날짜의 전날 06:00:00 계산
-        target_date = datetime.combine(analysis_date, datetime.min.time())
-        target_date_kst = seoul_tz.localize(target_date)
-        yesterday_6am = (target_date_kst - timedelta(days=1)).replace(hour=6, minute=0, second=0, microsecond=0)
+        # 분석 대상 날짜의 전날 06:00:00 계산 (벽시계 시각을 바로 만들어 localize, replace 체인 없이 DST에도 안전)
+        previous_date = analysis_date - timedelta(days=1)
+        yesterday_6am = SEOUL_TZ.localize(datetime(previous_date.year, previous_date.month, previous_date.day, 6))
         
         # 분석 대상 날짜의 23:59:59를 종료 시간으로 설정
-        end_datetime = target_date_kst.replace(hour=23, minute=59, second=59, microsecond=999999)
-        
-        print(f"📅 벡터 DB에서 뉴스 조회: {yesterday_6am.strftime('%Y-%m-%d %H:%M:%S')} ~ {end_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"📅 분석 대상 날짜: {analysis_date}")
+        end_datetime = SEOUL_TZ.localize(
+            datetime(analysis_date.year, analysis_date.month, analysis_date.day, 23, 59, 59, 999999)
+        )
         
-        # LangGraph를 사용한 보고서 생성 (db 전달)
-        graph = create_report_graph(db=db)
+        logger.info("📅 벡터 DB에서 뉴스 조회: %s ~ %s", yesterday_6am, end_datetime)
+        logger.info("📅 분석 대상 날짜: %s", analysis_date)
         
         # 초기 상태 설정
-        current_time = datetime.now(seoul_tz)
+        current_time = datetime.now(SEOUL_TZ)
         initial_state: ReportGenerationState = {
             "analysis_date": analysis_date,
             "current_time": current_time,
@@ -150,14 +213,18 @@ async def analyze_news(
         }
         
         # 그래프 실행
-        print("🚀 LangGraph 실행 시작...")
-        final_state = graph.invoke(initial_state)
+        logger.info("🚀 LangGraph 실행 시작...")
+        # LangGraph를 사용한 보고서 생성 (db는 RunnableConfig로 전달)
+        # LLM/DB 호출이 길게 블로킹되므로 이벤트 루프가 아닌 스레드풀에서 실행
+        final_state = await run_in_threadpool(
+            REPORT_GRAPH.invoke, initial_state, config={"configurable": {"db": db}}
+        )
         
         # 에러 확인
         errors = final_state.get("errors", [])
         if errors:
             error_msg = "; ".join(errors)
-            print(f"⚠️  그래프 실행 중 오류 발생: {error_msg}")
+            logger.warning("⚠️  그래프 실행 중 오류 발생: %s", error_msg)
             # 에러가 있어도 진행 (부분적 성공 허용)
         
         # 보고서 데이터 확인
@@ -168,19 +235,24 @@ async def analyze_news(
             raise ValueError("보고서 생성에 실패했습니다. 뉴스나 보고서 데이터가 없습니다.")
         
         # 데이터베이스에 저장
-        report = save_report_to_db(
+        report = await run_in_threadpool(
+            save_report_to_db,
             db=db,
             report_data=report_data,
             selected_news=selected_news,
             analysis_date=analysis_date
         )
         
+        _analyzed_report_ids[analysis_date] = report.id
+        # 새 보고서가 목록에 바로 보이도록 조회 캐시 무효화
+        clear_report_cache()
+        
         # 뉴스 개수 계산
         news_count = len(selected_news)
         
-        print(f"✅ 보고서 생성 완료: ID={report.id}, 뉴스 {news_count}개")
+        logger.info("✅ 보고서 생성 완료: ID=%s, 뉴스 %d개", report.id, news_count)
         
-        return AnalyzeResponse(
+        return _analyze_response(
             report_id=report.id,
             status="completed",
             message="분석이 완료되었습니다.",
@@ -188,19 +260,16 @@ async def analyze_news(
         )
     
     except ValueError as e:
-        print(f"ValueError 발생: {e}")
+        logger.warning("ValueError 발생: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except TypeError as e:
-        print(f"TypeError 발생: {e}")
+        logger.warning("TypeError 발생: %s", e)
         raise HTTPException(status_code=400, detail=f"요청 형식 오류: {str(e)}")
     except HTTPException:
         raise  # HTTPException은 그대로 전달
     except Exception as e:
-        import traceback
         error_detail = str(e)
-        error_traceback = traceback.format_exc()
-        print(f"분석 중 오류 발생: {error_detail}")
-        print(f"Traceback: {error_traceback}")
+        logger.exception("분석 중 오류 발생: %s", error_detail)
         raise HTTPException(
             status_code=500, 
             detail=f"분석 중 오류가 발생했습니다: {error_detail}"
@@ -6,8 +6,11 @@ from app.database import get_db
 router = APIRouter()
 
 @router.get("/health")
-async def health_check(db: Session = Depends(get_db)):
-    """헬스 체크 엔드포인트"""
+def health_check(db: Session = Depends(get_db)):
+    """
+    헬스 체크 엔드포인트
+    동기 DB 호출을 하므로 일반 함수로 두어 FastAPI가 스레드풀에서 실행하도록 함
+    """
     try:
         # 데이터베이스 연결 확인
         db.execute(text("SELECT 1"))
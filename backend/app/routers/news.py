@@ -3,20 +3,15 @@
 뉴스 수집 및 조회 엔드포인트
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime, date
 from typing import List, Optional
 from app.database import get_db
 from app.news import collect_news
-import sys
-import os
-
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
+from app.report_cache import clear_report_cache
 from models.models import NewsArticle
 
 router = APIRouter()
@@ -68,6 +63,22 @@ class NewsArticleResponse(BaseModel):
         from_attributes = True
 
 
+# ORM 객체 리스트를 응답 모델 리스트로 한 번에 변환 (pydantic-core에서 일괄 검증)
+_NEWS_ARTICLE_LIST_ADAPTER = TypeAdapter(List[NewsArticleResponse])
+
+# 뉴스 조회 응답에 필요한 컬럼만 선택 (ORM 객체/identity map 없이 행 단위로 조회)
+_NEWS_RESPONSE_COLUMNS = (
+    NewsArticle.id,
+    NewsArticle.title,
+    NewsArticle.content,
+    NewsArticle.source,
+    NewsArticle.url,
+    NewsArticle.published_at,
+    NewsArticle.collected_at,
+    NewsArticle.provider,
+)
+
+
 class NewsCollectionResponse(BaseModel):
     """뉴스 수집 응답 모델"""
     message: str
@@ -130,26 +141,16 @@ async def collect_news_endpoint(
             )
         
         # 뉴스 수집 및 저장
-        saved_articles = collect_news(
+        # collect_news는 블로킹 HTTP/DB 호출을 수행하므로 스레드풀에서 실행하여 이벤트 루프를 막지 않음
+        saved_articles = await run_in_threadpool(
+            collect_news,
             db=db,
             query=query,
             size=size
         )
         
         # 응답 데이터 구성
-        articles_response = [
-            NewsArticleResponse(
-                id=article.id,
-                title=article.title,
-                content=article.content,
-                source=article.source,
-                url=article.url,
-                published_at=article.published_at,
-                collected_at=article.collected_at,
-                provider=article.provider
-            )
-            for article in saved_articles
-        ]
+        articles_response = _NEWS_ARTICLE_LIST_ADAPTER.validate_python(saved_articles)
         
         return NewsCollectionResponse(
             message=f"뉴스 수집 완료: {len(saved_articles)}개 저장됨",
@@ -191,8 +192,8 @@ async def get_news(
       - `thenewsapi`: The News API
     """
     try:
-        # 기본 쿼리
-        query = db.query(NewsArticle)
+        # 기본 쿼리 (응답 필드 컬럼만 조회)
+        query = db.query(*_NEWS_RESPONSE_COLUMNS)
         
         # 날짜 필터링
         if start_date:
@@ -200,32 +201,22 @@ async def get_news(
         if end_date:
             query = query.filter(NewsArticle.published_at <= datetime.combine(end_date, datetime.max.time()))
         
-        # 키워드 필터링
+        # 키워드 필터링 (LIKE '%키워드%'는 title/content의 pg_trgm GIN 인덱스로 처리됨)
         if keyword:
             query = query.filter(
                 (NewsArticle.title.contains(keyword)) |
                 (NewsArticle.content.contains(keyword))
             )
         
-        # 정렬 및 페이징
-        articles = query.order_by(
+        # 정렬 및 페이징 (limit 최대 100건이므로 한 번에 조회)
+        rows = query.order_by(
             NewsArticle.published_at.desc()
         ).offset(offset).limit(limit).all()
         
         # 응답 데이터 구성
-        return [
-            NewsArticleResponse(
-                id=article.id,
-                title=article.title,
-                content=article.content,
-                source=article.source,
-                url=article.url,
-                published_at=article.published_at,
-                collected_at=article.collected_at,
-                provider=article.provider
-            )
-            for article in articles
-        ]
+        # DB에서 읽은 신뢰할 수 있는 컬럼 값이므로 모델 검증 없이 orjson으로 바로 직렬화
+        # (Response 객체는 FastAPI의 response_model 재검증/직렬화를 거치지 않음, response_model은 문서용으로 유지)
+        return ORJSONResponse(content=[row._asdict() for row in rows])
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -266,6 +257,10 @@ async def delete_old_news_endpoint(
         
         deleted_count = delete_old_news(db, days)
         
+        # 삭제된 뉴스는 report_news에서도 CASCADE로 빠지므로 캐시된 보고서 상세/목록을 무효화
+        if deleted_count:
+            clear_report_cache()
+        
         return {
             "message": f"{days}일 이상 지난 뉴스 {deleted_count}개가 삭제되었습니다.",
             "deleted_count": deleted_count
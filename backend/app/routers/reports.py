@@ -2,24 +2,23 @@
 보고서 조회 API 라우터
 보고서 목록 및 상세 조회 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, raiseload, selectinload
+from pydantic import BaseModel, TypeAdapter
 from datetime import date, datetime
 from typing import List, Optional
-from app.database import get_db
-import sys
-import os
-
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
-from models.models import Report, ReportIndustry, ReportStock, NewsArticle
+from app.database import DB_RAISELOAD, get_db
+from app.report_cache import get_cached_response, set_cached_response
+from models.models import Report, ReportIndustry, ReportStock, NewsArticle, report_news
 
 router = APIRouter()
 
+# 조회 응답 캐시 (프로세스 로컬)
+# 보고서 상세는 생성 후 바뀌지 않고, 오늘 목록은 새 보고서가 저장될 때만 바뀜
+REPORT_DETAIL_CACHE_TTL_SECONDS = 86400
+TODAY_REPORTS_CACHE_TTL_SECONDS = 300
+
 
 # 응답 모델 정의
 class NewsArticleResponse(BaseModel):
@@ -111,10 +110,16 @@ async def get_report(
     """
     보고서 상세 정보를 조회합니다.
     """
+    cache_key = f"report:{report_id}"
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
     # 보고서 조회 (관계 데이터를 한 번에 로드하여 N+1 문제 방지)
+    # 일대다 관계마다 별도 SELECT ... IN으로 로드하여 뉴스×산업×주식 JOIN으로 행이 불어나지 않도록 함
     report = db.query(Report).options(
-        joinedload(Report.news_articles),
-        joinedload(Report.industries).joinedload(ReportIndustry.stocks)
+        selectinload(Report.news_articles),
+        selectinload(Report.industries).selectinload(ReportIndustry.stocks)
     ).filter(Report.id == report_id).first()
     
     if not report:
@@ -127,13 +132,15 @@ async def get_report(
     if report.report_metadata and isinstance(report.report_metadata, dict):
         industries_data = report.report_metadata.get("industries", [])
         
+        # 산업명 → metadata 매핑을 한 번만 만들어 산업마다 O(1)로 조회 (같은 이름이면 첫 항목 사용)
+        metadata_by_name = {}
+        for ind in industries_data:
+            metadata_by_name.setdefault(ind.get("industry_name"), ind)
+        
         # 각 산업에 related_news 추가
         for industry in report.industries:
             # metadata에서 해당 산업 데이터 찾기
-            industry_metadata = next(
-                (ind for ind in industries_data if ind.get("industry_name") == industry.industry_name),
-                None
-            )
+            industry_metadata = metadata_by_name.get(industry.industry_name)
             
             if industry_metadata:
                 # related_news를 industry 객체에 동적으로 추가
@@ -150,31 +157,61 @@ async def get_report(
                     for news in related_news
                 ])
     
-    return report
+    # 세션과 분리된 응답 모델로 변환하여 캐시 (보고서 상세는 생성 후 변경되지 않음)
+    response = ReportDetailResponse.model_validate(report)
+    set_cached_response(cache_key, response, REPORT_DETAIL_CACHE_TTL_SECONDS)
+    
+    return response
 
 
-@router.get("/reports", response_model=List[ReportListItemResponse])
-async def get_all_reports(
-    limit: int = 10,
-    db: Session = Depends(get_db)
-):
+def _report_list_query(db: Session):
     """
-    전체 보고서 목록을 조회합니다 (분석 날짜 최신순).
+    보고서와 뉴스/산업 개수를 한 번의 SELECT로 조회하는 쿼리를 만듭니다.
+    관계 전체를 로드하지 않고 GROUP BY 서브쿼리로 개수만 집계합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        (Report, news_count, industry_count) 튜플을 반환하는 쿼리 (분석 날짜 최신순)
     """
-    # 전체 보고서 조회 (관계 데이터도 함께 로드)
+    news_counts = (
+        select(report_news.c.report_id, func.count().label("news_count"))
+        .group_by(report_news.c.report_id)
+        .subquery()
+    )
+    industry_counts = (
+        select(ReportIndustry.report_id, func.count().label("industry_count"))
+        .group_by(ReportIndustry.report_id)
+        .subquery()
+    )
+    
     # analysis_date 기준 최신순 정렬 (날짜가 같으면 created_at 기준)
-    reports = db.query(Report).options(
-        joinedload(Report.news_articles),
-        joinedload(Report.industries)
-    ).order_by(Report.analysis_date.desc(), Report.created_at.desc()).limit(limit).all()
-    
-    # 각 보고서의 뉴스 개수와 산업 개수 계산
-    result = []
-    for report in reports:
-        news_count = len(report.news_articles) if report.news_articles else 0
-        industry_count = len(report.industries) if report.industries else 0
-        
-        result.append(ReportListItemResponse(
+    query = db.query(
+        Report,
+        func.coalesce(news_counts.c.news_count, 0),
+        func.coalesce(industry_counts.c.industry_count, 0)
+    ).outerjoin(
+        news_counts, news_counts.c.report_id == Report.id
+    ).outerjoin(
+        industry_counts, industry_counts.c.report_id == Report.id
+    ).order_by(Report.analysis_date.desc(), Report.created_at.desc())
+    
+    # 목록 응답은 관계를 사용하지 않으므로, 개발 환경에서는 관계 접근(N+1)을 즉시 에러로 드러냄
+    if DB_RAISELOAD:
+        query = query.options(raiseload("*"))
+    
+    return query
+
+
+# 목록 응답을 JSON 바이트로 한 번에 직렬화 (캐시에는 직렬화된 스냅샷을 저장)
+_REPORT_LIST_ADAPTER = TypeAdapter(List[ReportListItemResponse])
+
+
+def _to_list_items(rows) -> List[ReportListItemResponse]:
+    """(Report, news_count, industry_count) 튜플을 목록 응답 모델로 변환합니다."""
+    return [
+        ReportListItemResponse(
             id=report.id,
             title=report.title,
             summary=report.summary,
@@ -183,9 +220,23 @@ async def get_all_reports(
             news_count=news_count,
             industry_count=industry_count,
             report_metadata=report.report_metadata
-        ))
+        )
+        for report, news_count, industry_count in rows
+    ]
+
+
+@router.get("/reports", response_model=List[ReportListItemResponse])
+async def get_all_reports(
+    limit: int = 10,
+    db: Session = Depends(get_db)
+):
+    """
+    전체 보고서 목록을 조회합니다 (분석 날짜 최신순).
+    """
+    # 뉴스/산업 개수는 SQL에서 집계하여 함께 조회
+    rows = _report_list_query(db).limit(limit).all()
     
-    return result
+    return _to_list_items(rows)
 
 
 @router.get("/reports/today", response_model=List[ReportListItemResponse])
@@ -197,30 +248,14 @@ async def get_today_reports(
     """
     today = date.today()
     
-    # 오늘 날짜의 보고서 조회 (관계 데이터도 함께 로드)
-    # analysis_date 기준 최신순 정렬 (날짜가 같으면 created_at 기준)
-    reports = db.query(Report).options(
-        joinedload(Report.news_articles),
-        joinedload(Report.industries)
-    ).filter(
-        Report.analysis_date == today
-    ).order_by(Report.analysis_date.desc(), Report.created_at.desc()).all()
-    
-    # 각 보고서의 뉴스 개수와 산업 개수 계산
-    result = []
-    for report in reports:
-        news_count = len(report.news_articles) if report.news_articles else 0
-        industry_count = len(report.industries) if report.industries else 0
-        
-        result.append(ReportListItemResponse(
-            id=report.id,
-            title=report.title,
-            summary=report.summary,
-            analysis_date=report.analysis_date,
-            created_at=report.created_at,
-            news_count=news_count,
-            industry_count=industry_count,
-            report_metadata=report.report_metadata
-        ))
+    # 캐시에는 직렬화가 끝난 JSON 스냅샷을 저장하여, 적중 시 DB 조회와 응답 인코딩을 모두 생략
+    # (Response 객체는 response_model 재검증을 거치지 않음, response_model은 문서용으로 유지)
+    cache_key = f"reports_today:{today.isoformat()}"
+    snapshot = get_cached_response(cache_key)
+    if snapshot is None:
+        # 오늘 날짜의 보고서와 뉴스/산업 개수를 한 번에 조회
+        rows = _report_list_query(db).filter(Report.analysis_date == today).all()
+        snapshot = _REPORT_LIST_ADAPTER.dump_json(_to_list_items(rows))
+        set_cached_response(cache_key, snapshot, TODAY_REPORTS_CACHE_TTL_SECONDS)
     
-    return result
+    return Response(content=snapshot, media_type="application/json")
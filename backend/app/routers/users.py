@@ -8,14 +8,7 @@ from sqlalchemy import func
 from pydantic import BaseModel
 from typing import Optional
 from app.database import get_db
-import sys
 import os
-
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
 from models.models import User
 
 router = APIRouter()
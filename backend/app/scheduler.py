@@ -3,80 +3,100 @@
 APScheduler를 사용하여 주기적인 작업을 스케줄링합니다.
 """
 import asyncio
+import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from fastapi.concurrency import run_in_threadpool
 from datetime import datetime, timedelta
+from typing import Optional
 import pytz
 import httpx
-import sys
+import orjson
 import os
+from app.database import SessionLocal
+from app.news import collect_news
 
-# app 패키지 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
+logger = logging.getLogger(__name__)
 
 # 전역 스케줄러 인스턴스
 scheduler = AsyncIOScheduler(timezone=pytz.timezone('Asia/Seoul'))
 
+# 자체 API 호출용 공유 HTTP 클라이언트 (작업마다 연결 풀을 새로 만들지 않도록 재사용)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    공유 httpx.AsyncClient를 지연 생성하여 반환합니다.
+    스케줄러 작업이 실행되는 이벤트 루프 안에서 처음 생성됩니다.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+        )
+    return _http_client
+
+
+class SchedulerAPIError(Exception):
+    """자체 API가 실패 응답을 반환한 경우 (상태 코드와 응답 본문은 발생 시점에 이미 로깅됨)"""
+
+
+async def close_http_client():
+    """
+    공유 HTTP 클라이언트를 닫습니다. 앱 종료 시 호출합니다.
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# 시간별 뉴스 수집 쿼리 (comma-separated 형식)
+HOURLY_NEWS_QUERY = "주식,증시,코스피,코스닥,반도체,경제,금리,부동산,주가,투자"
+HOURLY_NEWS_SIZE = 10  # 무료 티어 제한: 최대 10개
+
+
+def _collect_news_with_new_session(query: str, size: int) -> int:
+    """
+    전용 DB 세션을 열어 뉴스를 수집/저장하고 저장된 개수를 반환합니다.
+    스레드풀에서 실행되므로 세션은 이 함수 안에서 만들고 닫습니다.
+    """
+    db = SessionLocal()
+    try:
+        saved_articles = collect_news(db=db, query=query, size=size)
+        return len(saved_articles)
+    finally:
+        db.close()
+
 
 async def collect_news_hourly():
     """
     1시간마다 실행되는 뉴스 수집 작업.
-    POST /api/get_news API를 호출하여 최신 뉴스를 수집하고 저장합니다.
+    자체 API(POST /api/get_news)를 거치지 않고 같은 프로세스에서 collect_news를 직접 호출하여
+    최신 뉴스를 수집하고 저장합니다.
     """
     # 한국 시간대 설정
     seoul_tz = pytz.timezone('Asia/Seoul')
     now_kst = datetime.now(seoul_tz)
     
     try:
-        print("=" * 60)
-        print(f"📰 뉴스 수집 스케줄러 실행: {now_kst.strftime('%Y-%m-%d %H:%M:%S')} (KST)")
-        print("=" * 60)
-        
-        # API 엔드포인트 호출
-        api_url = os.getenv("API_BASE_URL", "http://localhost:8000")
-        get_news_url = f"{api_url}/api/get_news"
+        logger.info("📰 뉴스 수집 스케줄러 실행: %s (KST)", now_kst.strftime('%Y-%m-%d %H:%M:%S'))
+        logger.info("   쿼리: %s, 크기: %d", HOURLY_NEWS_QUERY, HOURLY_NEWS_SIZE)
         
-        # Query 파라미터 (comma-separated 형식)
-        query = "주식,증시,코스피,코스닥,반도체,경제,금리,부동산,주가,투자"
-        size = 10  # 무료 티어 제한: 최대 10개
+        # collect_news는 블로킹 HTTP/DB 호출을 수행하므로 스레드풀에서 실행하여 이벤트 루프를 막지 않음
+        collected_count = await run_in_threadpool(
+            _collect_news_with_new_session, HOURLY_NEWS_QUERY, HOURLY_NEWS_SIZE
+        )
         
-        # Query 파라미터로 전달
-        params = {
-            "query": query,
-            "size": size
+        logger.info("✅ 뉴스 수집 완료: %d개 저장됨", collected_count)
+        return {
+            "message": f"뉴스 수집 완료: {collected_count}개 저장됨",
+            "collected_count": collected_count
         }
         
-        print(f"📡 API 호출: POST {get_news_url}")
-        print(f"   쿼리: {query}")
-        print(f"   크기: {size}")
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:  # 1분 타임아웃
-            response = await client.post(get_news_url, params=params)
-            
-            if response.status_code == 200:
-                result = response.json()
-                collected_count = result.get("collected_count", 0)
-                print(f"✅ 뉴스 수집 완료: {collected_count}개 저장됨")
-                print("=" * 60)
-                return result
-            else:
-                error_detail = response.text
-                print(f"❌ API 호출 실패: {response.status_code}")
-                print(f"응답: {error_detail}")
-                print("=" * 60)
-                raise Exception(f"API 호출 실패 ({response.status_code}): {error_detail}")
-        
-    except httpx.TimeoutException:
-        print("❌ API 호출 타임아웃 (1분 초과)")
-        print("=" * 60)
-        raise
     except Exception as e:
-        import traceback
-        print(f"❌ 뉴스 수집 중 오류 발생: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
-        print("=" * 60)
+        logger.exception("❌ 뉴스 수집 중 오류 발생: %s", e)
         raise
 
 
@@ -91,10 +111,8 @@ async def run_daily_analysis():
     today_kst = now_kst.date()
     
     try:
-        print("=" * 60)
-        print(f"📊 일일 분석 스케줄러 실행: {now_kst.strftime('%Y-%m-%d %H:%M:%S')} (KST)")
-        print(f"📅 분석 대상 날짜: {today_kst.strftime('%Y-%m-%d')}")
-        print("=" * 60)
+        logger.info("📊 일일 분석 스케줄러 실행: %s (KST)", now_kst.strftime('%Y-%m-%d %H:%M:%S'))
+        logger.info("📅 분석 대상 날짜: %s", today_kst)
         
         # API 엔드포인트 호출
         api_url = os.getenv("API_BASE_URL", "http://localhost:8000")
@@ -106,38 +124,37 @@ async def run_daily_analysis():
             "date": today_kst.strftime("%Y-%m-%d")  # 한국 시간 기준 오늘 날짜
         }
         
-        print(f"📡 API 호출: POST {analyze_url}")
-        print(f"   요청 데이터: {request_data}")
+        logger.info("📡 API 호출: POST %s, 요청 데이터: %s", analyze_url, request_data)
+        
+        client = _get_http_client()
+        response = await client.post(analyze_url, json=request_data, timeout=300.0)  # 5분 타임아웃
         
-        async with httpx.AsyncClient(timeout=300.0) as client:  # 5분 타임아웃
-            response = await client.post(analyze_url, json=request_data)
-            
-            if response.status_code == 200:
-                result = response.json()
-                print(f"✅ 일일 분석 완료: 보고서 ID={result.get('report_id')}, 뉴스 {result.get('news_count')}개")
-                print("=" * 60)
-                return result
-            elif response.status_code == 400 and "already_exists" in response.text:
-                result = response.json()
-                print(f"ℹ️  이미 분석된 보고서 존재: 보고서 ID={result.get('report_id')}")
-                print("=" * 60)
-                return result
-            else:
-                error_detail = response.text
-                print(f"❌ API 호출 실패: {response.status_code}")
-                print(f"응답: {error_detail}")
-                print("=" * 60)
-                raise Exception(f"API 호출 실패 ({response.status_code}): {error_detail}")
+        # 본문 바이트를 그대로 orjson으로 파싱 (텍스트 디코딩 단계 생략)
+        if response.status_code == 200:
+            result = orjson.loads(response.content)
+            logger.info("✅ 일일 분석 완료: 보고서 ID=%s, 뉴스 %s개", result.get('report_id'), result.get('news_count'))
+            return result
+        elif response.status_code == 400 and b"already_exists" in response.content:
+            result = orjson.loads(response.content)
+            logger.info("ℹ️  이미 분석된 보고서 존재: 보고서 ID=%s", result.get('report_id'))
+            return result
+        else:
+            error_detail = response.text
+            logger.error("❌ API 호출 실패: %s, 응답: %s", response.status_code, error_detail)
+            raise SchedulerAPIError(f"API 호출 실패 ({response.status_code}): {error_detail}")
         
     except httpx.TimeoutException:
-        print("❌ API 호출 타임아웃 (5분 초과)")
-        print("=" * 60)
+        logger.error("❌ API 호출 타임아웃 (5분 초과)")
         raise
+    except SchedulerAPIError:
+        # 실패 응답은 이미 기록됨 (기존과 같이 일일 분석 실패는 전파하지 않음)
+        return None
+    except httpx.HTTPError as e:
+        # 연결 실패 등 예상 가능한 네트워크 오류는 traceback 없이 한 줄로 기록
+        logger.error("❌ API 호출 실패: %s", e)
+        return None
     except Exception as e:
-        import traceback
-        print(f"❌ 일일 분석 중 오류 발생: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
-        print("=" * 60)
+        logger.exception("❌ 일일 분석 중 오류 발생: %s", e)
 
 
 async def delete_old_news_daily():
@@ -150,9 +167,7 @@ async def delete_old_news_daily():
     now_kst = datetime.now(seoul_tz)
     
     try:
-        print("=" * 60)
-        print(f"🗑️ 오래된 뉴스 삭제 스케줄러 실행: {now_kst.strftime('%Y-%m-%d %H:%M:%S')} (KST)")
-        print("=" * 60)
+        logger.info("🗑️ 오래된 뉴스 삭제 스케줄러 실행: %s (KST)", now_kst.strftime('%Y-%m-%d %H:%M:%S'))
         
         # API 엔드포인트 호출
         api_url = os.getenv("API_BASE_URL", "http://localhost:8000")
@@ -161,34 +176,32 @@ async def delete_old_news_daily():
         # Query 파라미터
         params = {"days": 30}
         
-        print(f"📡 API 호출: DELETE {delete_url}")
-        print(f"   파라미터: {params}")
+        logger.info("📡 API 호출: DELETE %s, 파라미터: %s", delete_url, params)
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.delete(delete_url, params=params)
-            
-            if response.status_code == 200:
-                result = response.json()
-                deleted_count = result.get("deleted_count", 0)
-                print(f"✅ 오래된 뉴스 삭제 완료: {deleted_count}개 삭제됨")
-                print("=" * 60)
-                return result
-            else:
-                error_detail = response.text
-                print(f"❌ API 호출 실패: {response.status_code}")
-                print(f"응답: {error_detail}")
-                print("=" * 60)
-                raise Exception(f"API 호출 실패 ({response.status_code}): {error_detail}")
+        client = _get_http_client()
+        response = await client.delete(delete_url, params=params, timeout=60.0)
+        
+        if response.status_code == 200:
+            result = orjson.loads(response.content)
+            deleted_count = result.get("deleted_count", 0)
+            logger.info("✅ 오래된 뉴스 삭제 완료: %s개 삭제됨", deleted_count)
+            return result
+        else:
+            error_detail = response.text
+            logger.error("❌ API 호출 실패: %s, 응답: %s", response.status_code, error_detail)
+            raise SchedulerAPIError(f"API 호출 실패 ({response.status_code}): {error_detail}")
         
     except httpx.TimeoutException:
-        print("❌ API 호출 타임아웃 (1분 초과)")
-        print("=" * 60)
+        logger.error("❌ API 호출 타임아웃 (1분 초과)")
+        raise
+    except SchedulerAPIError:
+        raise
+    except httpx.HTTPError as e:
+        # 연결 실패 등 예상 가능한 네트워크 오류는 traceback 없이 한 줄로 기록
+        logger.error("❌ API 호출 실패: %s", e)
         raise
     except Exception as e:
-        import traceback
-        print(f"❌ 뉴스 삭제 중 오류 발생: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
-        print("=" * 60)
+        logger.exception("❌ 뉴스 삭제 중 오류 발생: %s", e)
         raise
 
 
@@ -197,7 +210,7 @@ def start_scheduler():
     스케줄러를 시작하고 작업을 등록합니다.
     """
     if scheduler.running:
-        print("⚠️  스케줄러가 이미 실행 중입니다.")
+        logger.warning("⚠️  스케줄러가 이미 실행 중입니다.")
         return
     
     # 1시간마다 뉴스 수집 실행
@@ -228,13 +241,11 @@ def start_scheduler():
     )
     
     scheduler.start()
-    print("✅ 스케줄러가 시작되었습니다.")
-    print("   - 매시간 정각(00분)에 뉴스 수집이 실행됩니다.")
-    print("   - 매일 04:00에 오래된 뉴스 삭제가 실행됩니다.")
-    print("   - 매일 06:00에 일일 분석이 실행됩니다.")
-
+    logger.info("✅ 스케줄러가 시작되었습니다.")
+    logger.info("   - 매시간 정각(00분)에 뉴스 수집이 실행됩니다.")
+    logger.info("   - 매일 04:00에 오래된 뉴스 삭제가 실행됩니다.")
+    logger.info("   - 매일 06:00에 일일 분석이 실행됩니다.")
 
-from apscheduler.triggers.cron import CronTrigger
 
 def stop_scheduler():
     """
@@ -242,7 +253,7 @@ def stop_scheduler():
     """
     if scheduler.running:
         scheduler.shutdown()
-        print("✅ 스케줄러가 중지되었습니다.")
+        logger.info("✅ 스케줄러가 중지되었습니다.")
     else:
-        print("⚠️  스케줄러가 실행 중이 아닙니다.")
+        logger.warning("⚠️  스케줄러가 실행 중이 아닙니다.")
 
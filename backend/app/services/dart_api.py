@@ -2,33 +2,118 @@
 DART API 서비스
 전자공시시스템(DART) OpenAPI를 사용하여 재무제표 데이터를 조회합니다.
 """
+import logging
 import os
+import shutil
+import tempfile
+import threading
 import requests
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 import time
-import sys
-import copy
-import json
 import zipfile
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import xml.etree.ElementTree as ET
 
-# models 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
+import orjson
+from requests.adapters import HTTPAdapter
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from urllib3.util.retry import Retry
 from models.models import FinancialStatement
 
+logger = logging.getLogger(__name__)
+
 
 DART_API_KEY = os.getenv("DART_API_KEY")
 DART_API_BASE_URL = "https://opendart.fss.or.kr/api"
 
+# DART API 호출용 공유 HTTP 세션 (회사/연도별 반복 호출 시 TCP/TLS 연결 재사용)
+_DART_SESSION = requests.Session()
+_DART_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        # 요청 제한(429)이나 일시적 서버 오류는 짧은 backoff로 재시도
+        # (재시도 후에도 실패하면 마지막 응답을 그대로 돌려줘 raise_for_status에서 처리)
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        ),
+    ),
+)
+_DART_SESSION.headers.update({"Accept-Encoding": "gzip"})
+
+# DART 요청 간 최소 간격 (초당 5회 제한 고려) 및 동시 요청 수
+DART_MIN_REQUEST_INTERVAL = 0.2
+DART_MAX_CONCURRENCY = 5
+
+# fnlttMultiAcnt 한 번에 조회할 수 있는 최대 회사 수
+DART_MULTI_BATCH_SIZE = 100
+_DART_RATE_LOCK = threading.Lock()
+_dart_next_request_at = 0.0
+
 # stock_code -> dart_code 매핑 테이블 캐시
 _stock_to_dart_mapping: Optional[Dict[str, str]] = None
 
+# 매핑 테이블 디스크 캐시 (재시작 시 corpCode.zip 재다운로드/파싱 생략, 하루 단위로 갱신)
+DART_MAPPING_CACHE_PATH = os.getenv(
+    "DART_MAPPING_CACHE_PATH",
+    os.path.join(tempfile.gettempdir(), "dart_stock_mapping.json")
+)
+DART_MAPPING_CACHE_TTL_SECONDS = 86400
+
+# corpCode.zip 디스크 캐시와 검증자(ETag/Last-Modified) 파일 (조건부 요청으로 304 시 본문 다운로드 생략)
+DART_CORPCODE_CACHE_PATH = os.getenv(
+    "DART_CORPCODE_CACHE_PATH",
+    os.path.join(tempfile.gettempdir(), "dart_corpcode.zip")
+)
+DART_CORPCODE_META_PATH = f"{DART_CORPCODE_CACHE_PATH}.meta"
+
+# 필요한 계정과목 매핑 (DART 계정명 -> 재무 지표 키)
+ACCOUNT_MAPPING = {
+    "매출액": "revenue",
+    "영업이익": "operating_profit",
+    "당기순이익": "net_income",
+    "자산총계": "total_assets",
+    "부채총계": "total_debt",
+    "자본총계": "equity",
+    "유동자산": "current_assets",
+    "유동부채": "current_liabilities"
+}
+
+# 매핑 계정명의 첫 글자 집합 (이 글자가 하나도 없는 계정명은 부분 일치 검사를 생략)
+_ACCOUNT_FIRST_CHARS = frozenset(korean_name[0] for korean_name in ACCOUNT_MAPPING)
+
+# 전기 대비 성장률을 계산하는 지표
+GROWTH_ACCOUNTS = frozenset(("revenue", "operating_profit", "net_income"))
+
+# 금액 문자열에서 제거할 문자 (천 단위 구분자, 음수 표기 괄호)
+_AMOUNT_STRIP_TABLE = str.maketrans("", "", ",()")
+
+
+def _wait_for_rate_limit() -> None:
+    """
+    DART 요청 슬롯을 예약하고 해당 시각까지 대기합니다.
+    여러 스레드가 동시에 호출해도 요청 시작 간격이 DART_MIN_REQUEST_INTERVAL 이상 유지됩니다.
+    """
+    global _dart_next_request_at
+    
+    with _DART_RATE_LOCK:
+        now = time.monotonic()
+        slot = max(now, _dart_next_request_at)
+        _dart_next_request_at = slot + DART_MIN_REQUEST_INTERVAL
+    
+    # 잠금 밖에서 대기하여 다른 스레드의 슬롯 예약을 막지 않음
+    if slot > now:
+        time.sleep(slot - now)
+
 
 def get_financial_statements(
     corp_code: str,
@@ -47,11 +132,12 @@ def get_financial_statements(
         재무제표 데이터 딕셔너리 또는 None (실패 시)
     """
     if not DART_API_KEY:
-        print("⚠️  DART_API_KEY 환경 변수가 설정되지 않았습니다.")
+        logger.warning("⚠️  DART_API_KEY 환경 변수가 설정되지 않았습니다.")
         return None
     
-    if not corp_code or len(corp_code) != 8:
-        print(f"⚠️  잘못된 DART 코드: {corp_code}")
+    # 길이 검사를 먼저 하여 대부분의 잘못된 값은 숫자 검사 전에 걸러냄
+    if not corp_code or len(corp_code) != 8 or not corp_code.isdigit():
+        logger.warning("⚠️  잘못된 DART 코드: %s", corp_code)
         return None
     
     # 기본값: 최근 연도
@@ -69,26 +155,102 @@ def get_financial_statements(
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        _wait_for_rate_limit()
+        response = _DART_SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
         
-        data = response.json()
+        # 숫자 위주의 응답이므로 바이트를 그대로 orjson으로 파싱
+        data = orjson.loads(response.content)
         
         if data.get("status") == "000":  # 정상
             return data
         else:
             error_msg = data.get("message", "알 수 없는 오류")
-            print(f"⚠️  DART API 오류: {error_msg} (corp_code: {corp_code})")
+            logger.warning("⚠️  DART API 오류: %s (corp_code: %s)", error_msg, corp_code)
             return None
             
     except requests.exceptions.RequestException as e:
-        print(f"⚠️  DART API 요청 실패: {e} (corp_code: {corp_code})")
+        logger.warning("⚠️  DART API 요청 실패: %s (corp_code: %s)", e, corp_code)
         return None
     except Exception as e:
-        print(f"⚠️  DART API 처리 실패: {e} (corp_code: {corp_code})")
+        logger.warning("⚠️  DART API 처리 실패: %s (corp_code: %s)", e, corp_code)
         return None
 
 
+def get_financial_statements_multi(
+    corp_codes: List[str],
+    bsns_year: str,
+    reprt_code: str = "11011"
+) -> Optional[Dict]:
+    """
+    DART 다중회사 주요계정 API(fnlttMultiAcnt)로 여러 회사의 재무제표를 한 번에 조회합니다.
+    
+    Args:
+        corp_codes: DART 기업코드 리스트 (8자리, 최대 DART_MULTI_BATCH_SIZE개)
+        bsns_year: 사업연도 (YYYY 형식)
+        reprt_code: 보고서 코드 (기본값: 11011 - 사업보고서)
+    
+    Returns:
+        재무제표 데이터 딕셔너리 (조회된 데이터가 없으면 빈 list) 또는 None (실패 시)
+    """
+    if not DART_API_KEY:
+        logger.warning("⚠️  DART_API_KEY 환경 변수가 설정되지 않았습니다.")
+        return None
+    
+    corp_codes = [code for code in corp_codes if code and len(code) == 8 and code.isdigit()]
+    if not corp_codes:
+        return {"status": "013", "list": []}
+    
+    url = f"{DART_API_BASE_URL}/fnlttMultiAcnt.json"
+    
+    params = {
+        "crtfc_key": DART_API_KEY,
+        "corp_code": ",".join(corp_codes),
+        "bsns_year": bsns_year,
+        "reprt_code": reprt_code
+    }
+    
+    try:
+        _wait_for_rate_limit()
+        response = _DART_SESSION.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        status = data.get("status")
+        
+        if status == "000":  # 정상
+            return data
+        elif status == "013":  # 조회된 데이터 없음
+            return {"status": status, "list": []}
+        else:
+            error_msg = data.get("message", "알 수 없는 오류")
+            logger.warning("⚠️  DART API 오류: %s (%d개 회사 일괄 조회)", error_msg, len(corp_codes))
+            return None
+            
+    except requests.exceptions.RequestException as e:
+        logger.warning("⚠️  DART API 요청 실패: %s (%d개 회사 일괄 조회)", e, len(corp_codes))
+        return None
+    except Exception as e:
+        logger.warning("⚠️  DART API 처리 실패: %s (%d개 회사 일괄 조회)", e, len(corp_codes))
+        return None
+
+
+def _parse_amount(value: Optional[str]) -> int:
+    """
+    DART 금액 문자열을 정수로 변환합니다. "(1,234)"처럼 괄호로 표기된 음수도 처리합니다.
+    
+    Args:
+        value: 금액 문자열 (예: "1,234", "-1,234", "(1,234)")
+    
+    Returns:
+        정수 금액 (빈 값이면 0)
+    """
+    if not value:
+        return 0
+    sign = -1 if value.lstrip().startswith("(") else 1
+    return sign * int(value.translate(_AMOUNT_STRIP_TABLE) or 0)
+
+
 def parse_financial_data(dart_data: Dict) -> Dict:
     """
     DART API 응답 데이터를 파싱하여 필요한 재무 지표를 추출합니다.
@@ -104,44 +266,74 @@ def parse_financial_data(dart_data: Dict) -> Dict:
     
     financial_items = {}
     
-    # 필요한 계정과목 매핑
-    account_mapping = {
-        "매출액": "revenue",
-        "영업이익": "operating_profit",
-        "당기순이익": "net_income",
-        "자산총계": "total_assets",
-        "부채총계": "total_debt",
-        "자본총계": "equity",
-        "유동자산": "current_assets",
-        "유동부채": "current_liabilities"
-    }
-    
     for item in dart_data.get("list", []):
         account_nm = item.get("account_nm", "")
         thstrm_amount = item.get("thstrm_amount", "0")  # 당기금액
         frmtrm_amount = item.get("frmtrm_amount", "0")  # 전기금액
         
-        # 계정과목이 매핑에 있는 경우
-        for korean_name, english_name in account_mapping.items():
-            if korean_name in account_nm:
-                try:
-                    amount = int(thstrm_amount.replace(",", "")) if thstrm_amount else 0
-                    prev_amount = int(frmtrm_amount.replace(",", "")) if frmtrm_amount else 0
-                    
-                    financial_items[english_name] = amount
-                    
-                    # 성장률 계산 (매출액, 영업이익, 당기순이익)
-                    if english_name in ["revenue", "operating_profit", "net_income"] and prev_amount > 0:
-                        growth_key = f"{english_name}_growth"
-                        financial_items[growth_key] = ((amount - prev_amount) / prev_amount) * 100
-                    
-                except (ValueError, AttributeError):
-                    pass
-                break
+        # 계정과목이 매핑에 있는 경우 (정확히 일치하는 경우를 먼저 조회)
+        english_name = ACCOUNT_MAPPING.get(account_nm.strip())
+        if english_name is None:
+            # "연결당기순이익"처럼 앞에 수식어가 붙는 경우가 있어 첫 글자만 보지 않고 포함 여부로 거름
+            if _ACCOUNT_FIRST_CHARS.isdisjoint(account_nm):
+                continue
+            english_name = next(
+                (name for korean_name, name in ACCOUNT_MAPPING.items() if korean_name in account_nm),
+                None
+            )
+        if english_name is None:
+            continue
+        
+        try:
+            amount = _parse_amount(thstrm_amount)
+            prev_amount = _parse_amount(frmtrm_amount)
+            
+            financial_items[english_name] = amount
+            
+            # 성장률 계산 (매출액, 영업이익, 당기순이익)
+            if english_name in GROWTH_ACCOUNTS and prev_amount > 0:
+                growth_key = f"{english_name}_growth"
+                financial_items[growth_key] = ((amount - prev_amount) / prev_amount) * 100
+            
+        except (ValueError, AttributeError):
+            pass
     
     return financial_items
 
 
+def _add_derived_ratios(financial_data: Dict) -> Dict:
+    """
+    파싱된 재무 데이터에 추가 계산 지표(영업이익률, 부채비율, 유동비율, 자기자본비율)를 더합니다.
+    
+    Args:
+        financial_data: parse_financial_data 결과 (제자리에서 갱신)
+    
+    Returns:
+        갱신된 재무 데이터 딕셔너리
+    """
+    revenue = financial_data.get("revenue")
+    operating_profit = financial_data.get("operating_profit")
+    total_assets = financial_data.get("total_assets")
+    total_debt = financial_data.get("total_debt")
+    current_assets = financial_data.get("current_assets")
+    current_liabilities = financial_data.get("current_liabilities")
+    equity = financial_data.get("equity")
+    
+    if revenue and operating_profit:
+        financial_data["operating_margin"] = (operating_profit / revenue) * 100
+    
+    if total_assets and total_debt:
+        financial_data["debt_ratio"] = (total_debt / total_assets) * 100
+    
+    if current_assets and current_liabilities:
+        financial_data["current_ratio"] = current_assets / current_liabilities if current_liabilities > 0 else 0
+    
+    if equity and total_assets:
+        financial_data["equity_ratio"] = (equity / total_assets) * 100
+    
+    return financial_data
+
+
 def get_company_financials(
     dart_code: str,
     stock_code: Optional[str] = None
@@ -159,9 +351,6 @@ def get_company_financials(
     if not dart_code:
         return None
     
-    # API 호출 제한을 고려하여 짧은 대기
-    time.sleep(0.1)
-    
     dart_data = get_financial_statements(dart_code)
     
     if not dart_data:
@@ -170,17 +359,7 @@ def get_company_financials(
     financial_data = parse_financial_data(dart_data)
     
     # 추가 계산 지표
-    if financial_data.get("revenue") and financial_data.get("operating_profit"):
-        financial_data["operating_margin"] = (financial_data["operating_profit"] / financial_data["revenue"]) * 100
-    
-    if financial_data.get("total_assets") and financial_data.get("total_debt"):
-        financial_data["debt_ratio"] = (financial_data["total_debt"] / financial_data["total_assets"]) * 100
-    
-    if financial_data.get("current_assets") and financial_data.get("current_liabilities"):
-        financial_data["current_ratio"] = financial_data["current_assets"] / financial_data["current_liabilities"] if financial_data["current_liabilities"] > 0 else 0
-    
-    if financial_data.get("equity") and financial_data.get("total_assets"):
-        financial_data["equity_ratio"] = (financial_data["equity"] / financial_data["total_assets"]) * 100
+    _add_derived_ratios(financial_data)
     
     return financial_data
 
@@ -209,14 +388,105 @@ def get_financial_from_db(db: Session, stock_code: str, dart_code: str, bsns_yea
         ).first()
         
         if financial_stmt and financial_stmt.financial_data:
-            # 딕셔너리를 deep copy하여 반환 (참조 공유 방지)
-            return copy.deepcopy(financial_stmt.financial_data)
+            # 값이 스칼라뿐인 평탄한 딕셔너리이므로 얕은 복사로 참조 공유 방지
+            return dict(financial_stmt.financial_data)
         return None
     except Exception as e:
-        print(f"⚠️  DB 조회 실패 ({stock_code}, {dart_code}, {bsns_year}): {e}")
+        logger.warning("⚠️  DB 조회 실패 (%s, %s, %s): %s", stock_code, dart_code, bsns_year, e)
         return None
 
 
+def get_financials_from_db_bulk(
+    db: Session,
+    keys: List[Tuple[str, str, str]]
+) -> Dict[Tuple[str, str, str], Dict]:
+    """
+    여러 (종목코드, DART 기업코드, 사업연도)의 재무제표를 한 번의 쿼리로 조회합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        keys: (stock_code, dart_code, bsns_year) 튜플 리스트
+    
+    Returns:
+        (stock_code, dart_code, bsns_year) -> 재무 데이터 딕셔너리 (DB에 있는 항목만)
+    """
+    keys = list(dict.fromkeys(key for key in keys if all(key)))
+    if not db or not keys:
+        return {}
+    
+    try:
+        rows = db.query(
+            FinancialStatement.stock_code,
+            FinancialStatement.dart_code,
+            FinancialStatement.bsns_year,
+            FinancialStatement.financial_data
+        ).filter(
+            tuple_(
+                FinancialStatement.stock_code,
+                FinancialStatement.dart_code,
+                FinancialStatement.bsns_year
+            ).in_(keys)
+        ).all()
+    except Exception as e:
+        logger.warning("⚠️  DB 일괄 조회 실패 (%d건): %s", len(keys), e)
+        return {}
+    
+    # 컬럼만 조회하므로 세션이 추적하는 객체와 딕셔너리를 공유하지 않음
+    return {
+        (stock_code, dart_code, bsns_year): financial_data
+        for stock_code, dart_code, bsns_year, financial_data in rows
+        if financial_data
+    }
+
+
+def save_financials_bulk(db: Session, rows: List[Dict]) -> int:
+    """
+    여러 재무제표를 한 번의 INSERT ... ON CONFLICT DO UPDATE로 저장합니다.
+    (stock_code, bsns_year) 유니크 제약 기준으로 이미 있으면 dart_code와 재무 데이터를 갱신합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        rows: stock_code, dart_code, bsns_year, financial_data 키를 가진 딕셔너리 리스트
+    
+    Returns:
+        저장한 레코드 수 (실패 시 0)
+    """
+    if not db:
+        return 0
+    
+    # 같은 문장 안에서 한 행을 두 번 갱신할 수 없으므로 유니크 키 기준으로 마지막 값만 남김
+    values_by_key = {}
+    for row in rows:
+        if row.get("stock_code") and row.get("dart_code") and row.get("bsns_year") and row.get("financial_data"):
+            values_by_key[(row["stock_code"], row["bsns_year"])] = {
+                "stock_code": row["stock_code"],
+                "dart_code": row["dart_code"],
+                "bsns_year": row["bsns_year"],
+                # 호출자의 딕셔너리와 참조를 공유하지 않도록 복사
+                "financial_data": dict(row["financial_data"])
+            }
+    
+    if not values_by_key:
+        return 0
+    
+    try:
+        stmt = pg_insert(FinancialStatement).values(list(values_by_key.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[FinancialStatement.stock_code, FinancialStatement.bsns_year],
+            set_={
+                "dart_code": stmt.excluded.dart_code,
+                "financial_data": stmt.excluded.financial_data
+            }
+        )
+        db.execute(stmt)
+        db.commit()
+        return len(values_by_key)
+    except Exception as e:
+        logger.warning("⚠️  DB 일괄 저장 실패 (%d건): %s", len(values_by_key), e)
+        db.rollback()
+        return 0
+
+
 def save_financial_to_db(
     db: Session,
     stock_code: str,
@@ -240,64 +510,35 @@ def save_financial_to_db(
     if not db or not stock_code or not dart_code or not bsns_year or not financial_data:
         return False
     
-    try:
-        # 딕셔너리를 JSON 문자열로 변환 후 다시 파싱하여 완전히 새로운 객체 생성
-        # 이렇게 하면 SQLAlchemy의 mutable 객체 참조 문제를 완전히 해결
-        financial_data_json = json.dumps(financial_data, ensure_ascii=False)
-        financial_data_final = json.loads(financial_data_json)
-        
-        # 디버깅: 저장 전 데이터 확인
-        revenue = financial_data_final.get("revenue", 0)
-        print(f"💾 저장 시도: stock_code={stock_code}, dart_code={dart_code}, bsns_year={bsns_year}, revenue={revenue}")
-        
-        # 기존 데이터 확인 (stock_code, dart_code, bsns_year 모두 일치해야 함)
-        existing = db.query(FinancialStatement).filter(
-            FinancialStatement.stock_code == stock_code,
-            FinancialStatement.dart_code == dart_code,
-            FinancialStatement.bsns_year == bsns_year
-        ).first()
-        
-        if existing:
-            # 업데이트 - 새로운 딕셔너리 객체로 교체
-            existing.financial_data = financial_data_final
-            print(f"🔄 업데이트: 기존 레코드 ID={existing.id}")
-        else:
-            # 새로 생성 - 완전히 새로운 딕셔너리 객체 사용
-            new_stmt = FinancialStatement(
-                stock_code=stock_code,
-                dart_code=dart_code,
-                bsns_year=bsns_year,
-                financial_data=financial_data_final
-            )
-            db.add(new_stmt)
-            print(f"➕ 새로 생성: stock_code={stock_code}, dart_code={dart_code}")
-        
-        db.commit()
-        
-        # commit 후 객체를 expire하여 세션에서 분리 (참조 공유 방지)
-        if existing:
-            db.expire(existing)
-        else:
-            db.expire(new_stmt)
-        
-        # 저장 후 검증: 실제로 저장된 데이터 확인
-        saved = db.query(FinancialStatement).filter(
-            FinancialStatement.stock_code == stock_code,
-            FinancialStatement.dart_code == dart_code,
-            FinancialStatement.bsns_year == bsns_year
-        ).first()
-        
-        if saved and saved.financial_data:
-            saved_revenue = saved.financial_data.get("revenue", 0)
-            print(f"✅ 저장 완료: ID={saved.id}, 저장된 revenue={saved_revenue}")
-        
-        return True
-    except Exception as e:
-        print(f"⚠️  DB 저장 실패 ({stock_code}, {dart_code}, {bsns_year}): {e}")
-        import traceback
-        traceback.print_exc()
-        db.rollback()
-        return False
+    return save_financials_bulk(db, [{
+        "stock_code": stock_code,
+        "dart_code": dart_code,
+        "bsns_year": bsns_year,
+        "financial_data": financial_data
+    }]) == 1
+
+
+def build_financial_data(dart_data: Dict) -> Optional[Dict]:
+    """
+    DART 응답을 파싱하고 추가 계산 지표(영업이익률, 부채비율 등)를 더합니다.
+    
+    Args:
+        dart_data: DART API 응답 데이터 (한 회사의 list)
+    
+    Returns:
+        파싱된 재무 데이터 딕셔너리 또는 None (데이터가 없는 경우)
+    """
+    financial_data = parse_financial_data(dart_data)
+    
+    # 데이터가 비어있으면 None 반환
+    if not financial_data:
+        return None
+    
+    # 추가 계산 지표
+    _add_derived_ratios(financial_data)
+    
+    # parse_financial_data가 호출마다 새 딕셔너리를 만들므로 복사 없이 반환
+    return financial_data
 
 
 def get_financial_statements_by_year(
@@ -317,46 +558,175 @@ def get_financial_statements_by_year(
     if not dart_code:
         return None
     
-    # API 호출 제한을 고려하여 짧은 대기
-    time.sleep(0.1)
-    
     dart_data = get_financial_statements(dart_code, bsns_year)
     
     if not dart_data:
         return None
     
-    financial_data = parse_financial_data(dart_data)
+    return build_financial_data(dart_data)
+
+
+def _fetch_by_year_concurrently(
+    dart_codes: List[str],
+    bsns_year: str
+) -> Dict[str, Dict]:
+    """
+    회사별 API(fnlttSinglAcnt)로 재무제표를 동시에 조회합니다.
+    요청 간격은 _wait_for_rate_limit로 제한하고, 응답 대기 시간만 스레드 간에 겹치도록 합니다.
     
-    # 데이터가 비어있으면 None 반환
-    if not financial_data:
-        return None
+    Args:
+        dart_codes: DART 기업코드 리스트 (8자리, 중복 없음)
+        bsns_year: 사업연도 (YYYY 형식)
     
-    # 추가 계산 지표
-    if financial_data.get("revenue") and financial_data.get("operating_profit"):
-        financial_data["operating_margin"] = (financial_data["operating_profit"] / financial_data["revenue"]) * 100
+    Returns:
+        dart_code -> 파싱된 재무 데이터 딕셔너리 (조회 실패한 회사는 제외)
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(len(dart_codes), DART_MAX_CONCURRENCY)) as executor:
+        futures = {
+            executor.submit(get_financial_statements_by_year, dart_code, bsns_year): dart_code
+            for dart_code in dart_codes
+        }
+        for future in as_completed(futures):
+            dart_code = futures[future]
+            try:
+                financial_data = future.result()
+            except Exception as e:
+                logger.warning("⚠️  재무제표 조회 실패 (%s, %s): %s", dart_code, bsns_year, e)
+                continue
+            if financial_data:
+                results[dart_code] = financial_data
+    
+    return results
+
+
+def _fetch_multi_chunk(chunk: List[str], bsns_year: str) -> Dict[str, Dict]:
+    """
+    한 묶음(최대 DART_MULTI_BATCH_SIZE개)의 재무제표를 다중회사 API로 조회하고 회사별로 파싱합니다.
+    일괄 조회가 실패하면 회사별 동시 조회로 대체합니다.
     
-    if financial_data.get("total_assets") and financial_data.get("total_debt"):
-        financial_data["debt_ratio"] = (financial_data["total_debt"] / financial_data["total_assets"]) * 100
+    Args:
+        chunk: DART 기업코드 리스트 (8자리, 중복 없음)
+        bsns_year: 사업연도 (YYYY 형식)
+    
+    Returns:
+        dart_code -> 파싱된 재무 데이터 딕셔너리 (조회 실패한 회사는 제외)
+    """
+    dart_data = get_financial_statements_multi(chunk, bsns_year)
+    if dart_data is None:
+        return _fetch_by_year_concurrently(chunk, bsns_year)
     
-    if financial_data.get("current_assets") and financial_data.get("current_liabilities"):
-        financial_data["current_ratio"] = financial_data["current_assets"] / financial_data["current_liabilities"] if financial_data["current_liabilities"] > 0 else 0
+    # 응답은 모든 회사의 계정이 한 목록에 섞여 있으므로 회사별로 분리
+    items_by_corp: Dict[str, List[Dict]] = {}
+    for item in dart_data.get("list", []):
+        items_by_corp.setdefault(item.get("corp_code"), []).append(item)
     
-    if financial_data.get("equity") and financial_data.get("total_assets"):
-        financial_data["equity_ratio"] = (financial_data["equity"] / financial_data["total_assets"]) * 100
+    results = {}
+    for dart_code in chunk:
+        financial_data = build_financial_data({"list": items_by_corp.get(dart_code)})
+        if financial_data:
+            results[dart_code] = financial_data
     
-    # 딕셔너리를 deep copy하여 반환 (참조 공유 방지)
-    return copy.deepcopy(financial_data)
+    return results
 
 
-def download_corpcode_xml() -> Optional[bytes]:
+def get_financial_statements_by_year_batch(
+    dart_codes: List[str],
+    bsns_year: str
+) -> Dict[str, Dict]:
     """
-    DART API에서 corpCode.xml 파일을 다운로드합니다.
+    여러 회사의 특정 연도 재무제표를 DART 다중회사 API로 일괄 조회합니다.
+    DART_MULTI_BATCH_SIZE개씩 묶어 동시에 요청하고, 일괄 조회가 실패한 묶음은 회사별 동시 조회로 대체합니다.
+    
+    Args:
+        dart_codes: DART 기업코드 리스트 (8자리)
+        bsns_year: 사업연도 (YYYY 형식)
     
     Returns:
-        XML 파일의 바이트 데이터 또는 None (실패 시)
+        dart_code -> 파싱된 재무 데이터 딕셔너리 (조회 실패한 회사는 제외)
+    """
+    dart_codes = list(dict.fromkeys(code for code in dart_codes if code))
+    if not dart_codes:
+        return {}
+    
+    chunks = [
+        dart_codes[start:start + DART_MULTI_BATCH_SIZE]
+        for start in range(0, len(dart_codes), DART_MULTI_BATCH_SIZE)
+    ]
+    if len(chunks) == 1:
+        return _fetch_multi_chunk(chunks[0], bsns_year)
+    
+    # 묶음 요청끼리도 응답 대기 시간을 겹치도록 동시에 실행 (요청 간격 제한은 유지)
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(len(chunks), DART_MAX_CONCURRENCY)) as executor:
+        futures = [executor.submit(_fetch_multi_chunk, chunk, bsns_year) for chunk in chunks]
+        for future in as_completed(futures):
+            try:
+                results.update(future.result())
+            except Exception as e:
+                logger.warning("⚠️  재무제표 일괄 조회 실패 (%s): %s", bsns_year, e)
+    
+    return results
+
+
+def _load_corpcode_validators() -> Dict[str, str]:
+    """
+    이전 다운로드의 ETag/Last-Modified로 조건부 요청 헤더를 만듭니다.
+    
+    Returns:
+        If-None-Match / If-Modified-Since 헤더 딕셔너리 (캐시가 없으면 빈 딕셔너리)
+    """
+    if not os.path.exists(DART_CORPCODE_CACHE_PATH):
+        return {}
+    
+    try:
+        with open(DART_CORPCODE_META_PATH, "rb") as f:
+            meta = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _save_corpcode_cache(zip_buffer: BytesIO, etag: Optional[str], last_modified: Optional[str]) -> None:
+    """
+    다운로드한 ZIP과 검증자를 디스크에 저장합니다. 검증자가 없으면 조건부 요청을 할 수 없으므로 저장하지 않습니다.
+    
+    Args:
+        zip_buffer: ZIP 파일 버퍼
+        etag: 응답의 ETag 헤더
+        last_modified: 응답의 Last-Modified 헤더
+    """
+    if not etag and not last_modified:
+        return
+    
+    tmp_path = f"{DART_CORPCODE_CACHE_PATH}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(zip_buffer.getbuffer())
+        os.replace(tmp_path, DART_CORPCODE_CACHE_PATH)
+        with open(DART_CORPCODE_META_PATH, "wb") as f:
+            f.write(orjson.dumps({"etag": etag, "last_modified": last_modified}))
+    except OSError as e:
+        logger.warning("⚠️  corpCode.zip 캐시 저장 실패: %s", e)
+
+
+def download_corpcode_zip() -> Optional[BytesIO]:
+    """
+    DART API에서 corpCode.xml이 담긴 ZIP 파일을 다운로드합니다.
+    응답 본문을 한 번에 메모리에 올리지 않고 청크 단위로 버퍼에 복사하며,
+    이전 다운로드의 검증자로 조건부 요청을 보내 304 응답이면 디스크 캐시를 사용합니다.
+    
+    Returns:
+        ZIP 파일 버퍼 (읽기 위치는 처음) 또는 None (실패 시)
     """
     if not DART_API_KEY:
-        print("⚠️  DART_API_KEY 환경 변수가 설정되지 않았습니다.")
+        logger.warning("⚠️  DART_API_KEY 환경 변수가 설정되지 않았습니다.")
         return None
     
     url = f"{DART_API_BASE_URL}/corpCode.xml"
@@ -366,35 +736,94 @@ def download_corpcode_xml() -> Optional[bytes]:
     }
     
     try:
-        print("📥 corpCode.xml 파일 다운로드 중...")
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        # ZIP 파일로 압축되어 있으므로 압축 해제
-        zip_file = zipfile.ZipFile(BytesIO(response.content))
-        xml_file = zip_file.open("CORPCODE.xml")
-        xml_content = xml_file.read()
-        xml_file.close()
-        zip_file.close()
+        logger.info("📥 corpCode.xml 파일 다운로드 중...")
+        headers = _load_corpcode_validators()
+        with _DART_SESSION.get(url, params=params, headers=headers, timeout=30, stream=True) as response:
+            if response.status_code == 304:
+                with open(DART_CORPCODE_CACHE_PATH, "rb") as f:
+                    zip_buffer = BytesIO(f.read())
+                logger.info("📦 corpCode.xml 변경 없음 (304), 캐시 사용")
+                return zip_buffer
+            
+            response.raise_for_status()
+            
+            # raw 스트림은 Content-Encoding을 풀지 않으므로 명시적으로 디코딩
+            response.raw.decode_content = True
+            zip_buffer = BytesIO()
+            shutil.copyfileobj(response.raw, zip_buffer, 65536)
+            
+            _save_corpcode_cache(zip_buffer, response.headers.get("ETag"), response.headers.get("Last-Modified"))
         
-        print(f"✅ corpCode.xml 다운로드 완료 ({len(xml_content)} bytes)")
-        return xml_content
+        zip_buffer.seek(0)
+        logger.info("✅ corpCode.xml 다운로드 완료 (%s bytes, ZIP)", zip_buffer.getbuffer().nbytes)
+        return zip_buffer
         
     except requests.exceptions.RequestException as e:
-        print(f"⚠️  corpCode.xml 다운로드 실패: {e}")
-        return None
-    except zipfile.BadZipFile as e:
-        print(f"⚠️  ZIP 파일 파싱 실패: {e}")
+        logger.warning("⚠️  corpCode.xml 다운로드 실패: %s", e)
         return None
     except Exception as e:
-        print(f"⚠️  corpCode.xml 처리 실패: {e}")
+        logger.warning("⚠️  corpCode.xml 처리 실패: %s", e)
         return None
 
 
+def download_corpcode_xml() -> Optional[bytes]:
+    """
+    DART API에서 corpCode.xml 파일을 다운로드합니다.
+    
+    Returns:
+        XML 파일의 바이트 데이터 또는 None (실패 시)
+    """
+    zip_buffer = download_corpcode_zip()
+    if zip_buffer is None:
+        return None
+    
+    try:
+        # ZIP 파일로 압축되어 있으므로 압축 해제
+        with zipfile.ZipFile(zip_buffer) as zip_file, zip_file.open("CORPCODE.xml") as xml_file:
+            return xml_file.read()
+    except (zipfile.BadZipFile, KeyError) as e:
+        logger.warning("⚠️  ZIP 파일 파싱 실패: %s", e)
+        return None
+
+
+def _load_mapping_from_disk() -> Optional[Dict[str, str]]:
+    """
+    디스크에 저장된 매핑 테이블을 읽습니다.
+    
+    Returns:
+        매핑 딕셔너리 또는 None (파일이 없거나 만료/손상된 경우)
+    """
+    try:
+        if time.time() - os.path.getmtime(DART_MAPPING_CACHE_PATH) > DART_MAPPING_CACHE_TTL_SECONDS:
+            return None
+        with open(DART_MAPPING_CACHE_PATH, "rb") as f:
+            mapping = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    
+    return mapping if isinstance(mapping, dict) and mapping else None
+
+
+def _save_mapping_to_disk(mapping: Dict[str, str]) -> None:
+    """
+    매핑 테이블을 디스크에 저장합니다. 임시 파일에 쓴 뒤 교체하여 부분 쓰기를 방지합니다.
+    
+    Args:
+        mapping: stock_code -> dart_code 매핑 딕셔너리
+    """
+    tmp_path = f"{DART_MAPPING_CACHE_PATH}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(mapping))
+        os.replace(tmp_path, DART_MAPPING_CACHE_PATH)
+    except OSError as e:
+        logger.warning("⚠️  매핑 테이블 캐시 저장 실패: %s", e)
+
+
 def load_stock_to_dart_mapping() -> Dict[str, str]:
     """
     corpCode.xml 파일을 파싱하여 stock_code -> dart_code 매핑 테이블을 생성합니다.
-    매핑 테이블은 모듈 레벨에서 캐싱됩니다.
+    매핑 테이블은 모듈 레벨과 디스크(DART_MAPPING_CACHE_PATH)에 캐싱됩니다.
     
     Returns:
         stock_code -> dart_code 매핑 딕셔너리
@@ -405,27 +834,34 @@ def load_stock_to_dart_mapping() -> Dict[str, str]:
     if _stock_to_dart_mapping is not None:
         return _stock_to_dart_mapping
     
-    print("📊 stock_code -> dart_code 매핑 테이블 생성 중...")
+    # 디스크 캐시가 유효하면 다운로드 없이 사용
+    cached_mapping = _load_mapping_from_disk()
+    if cached_mapping is not None:
+        _stock_to_dart_mapping = cached_mapping
+        logger.info("📦 매핑 테이블 캐시 로드 완료: %d개 회사", len(cached_mapping))
+        return _stock_to_dart_mapping
+    
+    logger.info("📊 stock_code -> dart_code 매핑 테이블 생성 중...")
     
-    # XML 파일 다운로드
-    xml_content = download_corpcode_xml()
-    if not xml_content:
-        print("⚠️  매핑 테이블 생성 실패: XML 파일을 다운로드할 수 없습니다.")
+    # ZIP 파일 다운로드
+    zip_buffer = download_corpcode_zip()
+    if zip_buffer is None:
+        logger.warning("⚠️  매핑 테이블 생성 실패: XML 파일을 다운로드할 수 없습니다.")
         _stock_to_dart_mapping = {}
         return _stock_to_dart_mapping
     
-    # XML 파싱
+    # XML 파싱 (압축 해제 스트림을 그대로 파서에 전달하여 XML 전체를 메모리에 올리지 않음)
     mapping = {}
     try:
-        root = ET.fromstring(xml_content)
-        
-        for corp in root.findall("list"):
-            corp_code = corp.find("corp_code")
-            stock_code = corp.find("stock_code")
-            
-            if corp_code is not None and stock_code is not None:
-                corp_code_text = corp_code.text.strip() if corp_code.text else ""
-                stock_code_text = stock_code.text.strip() if stock_code.text else ""
+        with zipfile.ZipFile(zip_buffer) as zip_file, zip_file.open("CORPCODE.xml") as xml_file:
+            # 전체 DOM을 만들지 않고 <list> 요소 단위로 스트리밍 파싱 후 즉시 해제
+            for _, corp in ET.iterparse(xml_file):
+                if corp.tag != "list":
+                    continue
+                
+                corp_code_text = (corp.findtext("corp_code") or "").strip()
+                stock_code_text = (corp.findtext("stock_code") or "").strip()
+                corp.clear()
                 
                 # stock_code가 비어있지 않고 6자리 숫자인 경우만 추가
                 if stock_code_text and len(stock_code_text) == 6 and stock_code_text.isdigit():
@@ -433,23 +869,29 @@ def load_stock_to_dart_mapping() -> Dict[str, str]:
                         mapping[stock_code_text] = corp_code_text
         
         _stock_to_dart_mapping = mapping
-        print(f"✅ 매핑 테이블 생성 완료: {len(mapping)}개 회사")
+        logger.info("✅ 매핑 테이블 생성 완료: %d개 회사", len(mapping))
         
+        if mapping:
+            _save_mapping_to_disk(mapping)
+        
+    except (zipfile.BadZipFile, KeyError) as e:
+        logger.warning("⚠️  ZIP 파일 파싱 실패: %s", e)
+        _stock_to_dart_mapping = {}
     except ET.ParseError as e:
-        print(f"⚠️  XML 파싱 실패: {e}")
+        logger.warning("⚠️  XML 파싱 실패: %s", e)
         _stock_to_dart_mapping = {}
     except Exception as e:
-        print(f"⚠️  매핑 테이블 생성 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("⚠️  매핑 테이블 생성 실패: %s", e)
         _stock_to_dart_mapping = {}
     
     return _stock_to_dart_mapping
 
 
+@lru_cache(maxsize=4096)
 def get_dart_code_from_stock_code(stock_code: str) -> Optional[str]:
     """
     stock_code로부터 dart_code를 조회합니다.
+    매핑 테이블은 프로세스 동안 바뀌지 않으므로 종목코드별 결과를 메모이즈합니다.
     
     Args:
         stock_code: 종목코드 (6자리)
@@ -469,5 +911,5 @@ def get_dart_code_from_stock_code(stock_code: str) -> Optional[str]:
     if dart_code:
         return dart_code
     else:
-        print(f"⚠️  stock_code {stock_code}에 대한 dart_code를 찾을 수 없습니다.")
+        logger.warning("⚠️  stock_code %s에 대한 dart_code를 찾을 수 없습니다.", stock_code)
         return None
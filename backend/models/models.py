@@ -1,15 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, DATE, DECIMAL, ForeignKey, Table, Boolean, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, DATE, DECIMAL, Float, ForeignKey, Table, Boolean, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import JSONB
-import sys
-import os
-
-# app 패키지 경로 추가
-backend_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
 from app.database import Base
 
 # 보고서-뉴스 다대다 관계 테이블
@@ -17,7 +9,9 @@ report_news = Table(
     'report_news',
     Base.metadata,
     Column('report_id', Integer, ForeignKey('reports.id', ondelete='CASCADE'), primary_key=True),
-    Column('news_id', Integer, ForeignKey('news_articles.id', ondelete='CASCADE'), primary_key=True)
+    Column('news_id', Integer, ForeignKey('news_articles.id', ondelete='CASCADE'), primary_key=True),
+    # PK는 (report_id, news_id) 순서라 news_id 단독 조회(오래된 뉴스 삭제 시 CASCADE)에는 별도 인덱스 필요
+    Index('ix_report_news_news_id', 'news_id')
 )
 
 class NewsArticle(Base):
@@ -27,18 +21,30 @@ class NewsArticle(Base):
     title = Column(String(500), nullable=False)
     content = Column(Text)
     source = Column(String(255))
-    url = Column(String(1000))
-    published_at = Column(TIMESTAMP)
+    url = Column(String(1000), unique=True, index=True)  # URL 기반 중복 방지 (ON CONFLICT DO NOTHING)
+    published_at = Column(TIMESTAMP, index=True)  # 뉴스 조회 ORDER BY published_at DESC LIMIT용
     collected_at = Column(TIMESTAMP, server_default=func.now())
     provider = Column(String(50))  # 뉴스 API 제공자 (newsdata, naver, gnews, thenewsapi)
     # embedding은 pgvector vector(1536) 타입이므로 SQLAlchemy 모델에서는 제외
-    # SQL로 직접 저장/조회 (save_embedding_to_db 함수 사용)
+    # SQL로 직접 저장/조회 (app.news.save_embeddings_bulk 함수 사용)
     article_metadata = Column("metadata", JSONB)  # 벡터 DB metadata (title, url, published_date, collected_at 포함)
 
     # 관계
     reports = relationship("Report", secondary=report_news, back_populates="news_articles")
 
 
+class NewsImpactScore(Base):
+    __tablename__ = "news_impact_scores"
+
+    # 뉴스별 LLM 주식 영향도 점수 캐시 (모델/프롬프트별로 따로 보관하여 바뀌어도 기존 점수를 덮어쓰지 않음)
+    news_id = Column(Integer, ForeignKey('news_articles.id', ondelete='CASCADE'), primary_key=True)
+    model = Column(String(100), primary_key=True)
+    prompt_sha = Column(String(64), primary_key=True)
+    score = Column(Float, nullable=False)
+    reason = Column(Text)
+    created_at = Column(TIMESTAMP, server_default=func.now(), index=True)
+
+
 class Report(Base):
     __tablename__ = "reports"
 
@@ -46,9 +52,15 @@ class Report(Base):
     title = Column(String(500), nullable=False)
     summary = Column(Text)
     created_at = Column(TIMESTAMP, server_default=func.now())
-    analysis_date = Column(DATE, nullable=False)
+    analysis_date = Column(DATE, nullable=False)  # force 재분석 시 같은 날짜에 여러 보고서가 있을 수 있음
     report_metadata = Column("metadata", JSONB)  # report_data 저장용 (related_news 등 포함)
 
+    # 목록 조회 정렬(analysis_date DESC, created_at DESC)과 날짜 조회를 함께 처리하는 복합 인덱스
+    # (B-tree는 역방향 스캔이 가능하므로 DESC 정렬도 Sort 없이 인덱스 순서로 읽음)
+    __table_args__ = (
+        Index('ix_reports_analysis_date_created_at', 'analysis_date', 'created_at'),
+    )
+
     # 관계
     news_articles = relationship("NewsArticle", secondary=report_news, back_populates="reports")
     industries = relationship("ReportIndustry", back_populates="report", cascade="all, delete-orphan")
@@ -58,7 +70,7 @@ class ReportIndustry(Base):
     __tablename__ = "report_industries"
 
     id = Column(Integer, primary_key=True, index=True)
-    report_id = Column(Integer, ForeignKey('reports.id', ondelete='CASCADE'), nullable=False)
+    report_id = Column(Integer, ForeignKey('reports.id', ondelete='CASCADE'), nullable=False, index=True)  # 보고서별 산업 selectinload/개수 집계용
     industry_name = Column(String(255), nullable=False)
     impact_level = Column(String(50))  # 'high', 'medium', 'low'
     impact_description = Column(Text)
@@ -75,8 +87,8 @@ class ReportStock(Base):
     __tablename__ = "report_stocks"
 
     id = Column(Integer, primary_key=True, index=True)
-    report_id = Column(Integer, ForeignKey('reports.id', ondelete='CASCADE'), nullable=False)
-    industry_id = Column(Integer, ForeignKey('report_industries.id', ondelete='CASCADE'), nullable=False)
+    report_id = Column(Integer, ForeignKey('reports.id', ondelete='CASCADE'), nullable=False, index=True)  # 보고서 삭제 CASCADE용
+    industry_id = Column(Integer, ForeignKey('report_industries.id', ondelete='CASCADE'), nullable=False, index=True)  # 산업별 종목 selectinload용
     stock_code = Column(String(50))
     stock_name = Column(String(255))
     expected_trend = Column(String(50))  # 'up', 'down', 'neutral'
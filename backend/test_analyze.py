@@ -10,14 +10,21 @@ import sys
 API_BASE_URL = "http://localhost:8000"
 
 
-def test_health():
+def create_session():
+    """테스트 요청 간 연결을 재사용하는 HTTP 세션 생성 (응답은 gzip 압축 요청)"""
+    session = requests.Session()
+    session.headers.update({"Accept-Encoding": "gzip"})
+    return session
+
+
+def check_health(session):
     """헬스 체크 테스트"""
     print("=" * 50)
     print("1. 헬스 체크 테스트")
     print("=" * 50)
     
     try:
-        response = requests.get(f"{API_BASE_URL}/api/health", timeout=5)
+        response = session.get(f"{API_BASE_URL}/api/health", timeout=5)
         response.raise_for_status()
         data = response.json()
         print(f"✅ 상태: {data.get('status')}")
@@ -28,7 +35,7 @@ def test_health():
         return False
 
 
-def test_analyze(query="주식", count=10, force=False):
+def run_analyze(session, query="주식", count=10, force=False):
     """분석 API 테스트"""
     print("\n" + "=" * 50)
     print("2. 뉴스 수집 및 AI 분석 테스트")
@@ -45,7 +52,7 @@ def test_analyze(query="주식", count=10, force=False):
     print("\n분석 중... (잠시만 기다려주세요)")
     
     try:
-        response = requests.post(url, json=payload, timeout=120)  # AI 분석은 시간이 걸릴 수 있음
+        response = session.post(url, json=payload, timeout=120)  # AI 분석은 시간이 걸릴 수 있음
         response.raise_for_status()
         data = response.json()
         
@@ -76,15 +83,17 @@ def main():
     print("Day 2 기능 테스트 시작")
     print("=" * 50)
     
+    session = create_session()
+    
     # 1. 헬스 체크
-    if not test_health():
+    if not check_health(session):
         print("\n❌ 서버가 실행 중이지 않습니다.")
         print("   다음 명령어로 서버를 실행하세요:")
         print("   docker-compose up -d")
         sys.exit(1)
     
     # 2. 분석 테스트
-    report_id = test_analyze(query="주식", count=10, force=False)
+    report_id = run_analyze(session, query="주식", count=10, force=False)
     
     if report_id:
         print("\n" + "=" * 50)